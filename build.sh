@@ -25,7 +25,12 @@ if ! command -v $PYTHON &> /dev/null; then
 fi
 
 echo "[1/7] Installing dependencies..."
-$PYTHON -m pip install --upgrade customtkinter send2trash pyinstaller
+$PYTHON -m pip install --upgrade customtkinter send2trash pyinstaller cython pyobjc-framework-Cocoa
+if $PYTHON -m Cython.Build.Cythonize -i -q core/_fastwalk.pyx; then
+    echo "  Native directory walker compiled."
+else
+    echo "  Could not compile core/_fastwalk.pyx — using the Python walker."
+fi
 echo ""
 
 echo "[2/7] Converting icon to .icns format..."
@@ -76,6 +81,8 @@ a = Analysis(
         'customtkinter',
         'send2trash',
         'tkinter',
+        'AppKit',
+        'Foundation',
     ],
     hookspath=[],
     hooksconfig={},
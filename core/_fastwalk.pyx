@@ -0,0 +1,69 @@
+# cython: language_level=3
+"""
+Native directory sizing for Mac Cleanup Tool.
+
+Walks a tree with fts(3) while the GIL is released, so sizing large cache
+and download folders runs in parallel with the other scanner threads.
+Built by build.sh with ``python3 -m Cython.Build.Cythonize -i``;
+core.utils falls back to the pure-Python walker when it is not compiled.
+"""
+
+from libc.stdint cimport int64_t
+from posix.stat cimport S_ISREG, stat, struct_stat
+
+
+cdef extern from "<fts.h>" nogil:
+    ctypedef struct FTS:
+        pass
+
+    ctypedef struct FTSENT:
+        char *fts_accpath
+        short fts_level
+        unsigned short fts_info
+        struct_stat *fts_statp
+
+    FTS *fts_open(char **path_argv, int options, void *compar)
+    FTSENT *fts_read(FTS *ftsp)
+    int fts_close(FTS *ftsp)
+
+    int FTS_COMFOLLOW
+    int FTS_NOCHDIR
+    int FTS_PHYSICAL
+    unsigned short FTS_F
+    unsigned short FTS_SL
+
+
+def dir_size(bytes path, bint follow_symlinks=False):
+    """
+    Return the total size of regular files below path.
+
+    Mirrors core.utils.get_directory_size: symlinked directories are never
+    descended, file symlinks count only when follow_symlinks is set, and
+    unreadable entries are skipped.
+    """
+    cdef char *argv[2]
+    cdef FTS *fts
+    cdef FTSENT *ent
+    cdef struct_stat st
+    cdef int64_t total = 0
+
+    argv[0] = path
+    argv[1] = NULL
+
+    with nogil:
+        fts = fts_open(argv, FTS_PHYSICAL | FTS_NOCHDIR | FTS_COMFOLLOW, NULL)
+        if fts != NULL:
+            while True:
+                ent = fts_read(fts)
+                if ent == NULL:
+                    break
+                if ent.fts_level == 0:
+                    continue
+                if ent.fts_info == FTS_F:
+                    total += ent.fts_statp.st_size
+                elif ent.fts_info == FTS_SL and follow_symlinks:
+                    if stat(ent.fts_accpath, &st) == 0 and S_ISREG(st.st_mode):
+                        total += st.st_size
+            fts_close(fts)
+
+    return total
@@ -6,16 +6,21 @@ Default behavior is "move to Trash" — never permanent delete.
 """
 
 import logging
+import os
 import shutil
 import subprocess
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from core.models import ItemStatus, ScanItem
-from core.rules import TRASH_PATH, is_path_safe_for_deletion
+from core.rules import TRASH_PATH, clear_rule_caches, is_path_safe_for_deletion
 
 logger = logging.getLogger("mac_cleanup")
 
+TRASH_UNLINK_WORKERS = 32
+
 try:
     from send2trash import send2trash as _send2trash_func
     HAS_SEND2TRASH = True
@@ -28,18 +33,15 @@ except ImportError:
 def _move_to_trash_fallback(path: Path) -> None:
     """
     Fallback method to move a file/dir to ~/.Trash when send2trash is unavailable.
-    Handles name conflicts by appending a counter.
+    Handles name conflicts by appending a random suffix, so a crowded Trash
+    costs one extra stat rather than one per existing duplicate.
     """
     trash = TRASH_PATH
     trash.mkdir(exist_ok=True)
 
     dest = trash / path.name
-    counter = 1
     while dest.exists():
-        stem = path.stem
-        suffix = path.suffix
-        dest = trash / f"{stem}_{counter}{suffix}"
-        counter += 1
+        dest = trash / f"{path.stem}_{uuid.uuid4().hex[:8]}{path.suffix}"
 
     if path.is_dir():
         shutil.move(str(path), str(dest))
@@ -61,6 +63,62 @@ def move_to_trash(path: Path) -> None:
         _move_to_trash_fallback(path)
 
 
+def _trash_one(item: ScanItem) -> Tuple[ScanItem, bool, str]:
+    """Move a single item to Trash, recording the outcome on the item."""
+    try:
+        move_to_trash(item.path)
+        item.status = ItemStatus.TRASHED
+        return item, True, "Moved to Trash"
+    except PermissionError as e:
+        item.status = ItemStatus.FAILED
+        item.failure_reason = f"Permission denied: {e}"
+        logger.error(f"Permission denied deleting {item.path}: {e}")
+        return item, False, f"Permission denied: {e}"
+    except OSError as e:
+        item.status = ItemStatus.FAILED
+        item.failure_reason = f"OS error: {e}"
+        logger.error(f"OS error deleting {item.path}: {e}")
+        return item, False, f"OS error: {e}"
+    except Exception as e:
+        item.status = ItemStatus.FAILED
+        item.failure_reason = str(e)
+        logger.error(f"Unexpected error deleting {item.path}: {e}", exc_info=True)
+        return item, False, str(e)
+
+
+def _trash_items(items: List[ScanItem]) -> List[Tuple[ScanItem, bool, str]]:
+    """
+    Move already-validated items to Trash.
+
+    With send2trash available, all paths go to Trash in one call so the
+    platform trash API handshake is paid once. If that batch fails, items
+    are retried one by one for error isolation; anything the batch already
+    moved is recognised by no longer existing.
+    """
+    batch_attempted = False
+    if HAS_SEND2TRASH and _send2trash_func is not None and len(items) > 1:
+        batch_attempted = True
+        try:
+            _send2trash_func([str(item.path) for item in items])
+        except Exception as e:
+            logger.warning(f"Batch move to trash failed, retrying individually: {e}")
+        else:
+            for item in items:
+                item.status = ItemStatus.TRASHED
+                logger.info(f"Moved to trash (send2trash): {item.path}")
+            return [(item, True, "Moved to Trash") for item in items]
+
+    results: List[Tuple[ScanItem, bool, str]] = []
+    for item in items:
+        if batch_attempted and not os.path.lexists(item.path):
+            item.status = ItemStatus.TRASHED
+            logger.info(f"Moved to trash (send2trash): {item.path}")
+            results.append((item, True, "Moved to Trash"))
+            continue
+        results.append(_trash_one(item))
+    return results
+
+
 def delete_items(
     items: List[ScanItem],
     allow_personal: bool = False,
@@ -75,9 +133,16 @@ def delete_items(
         dry_run: If True, only simulate deletion (no actual changes).
 
     Returns:
-        List of (item, success, message) tuples.
+        List of (item, success, message) tuples. Items rejected by the
+        checks come first, followed by the items that were sent to Trash.
     """
     results: List[Tuple[ScanItem, bool, str]] = []
+    to_trash: List[ScanItem] = []
+
+    # Never act on a safety decision memoized during an earlier scan:
+    # symlinks may have been swapped since then.
+    if not dry_run:
+        clear_rule_caches()
 
     for item in items:
         if dry_run:
@@ -98,29 +163,81 @@ def delete_items(
             results.append((item, False, "File not found"))
             continue
 
-        try:
-            move_to_trash(item.path)
-            item.status = ItemStatus.TRASHED
-            results.append((item, True, "Moved to Trash"))
-        except PermissionError as e:
-            item.status = ItemStatus.FAILED
-            item.failure_reason = f"Permission denied: {e}"
-            results.append((item, False, f"Permission denied: {e}"))
-            logger.error(f"Permission denied deleting {item.path}: {e}")
-        except OSError as e:
-            item.status = ItemStatus.FAILED
-            item.failure_reason = f"OS error: {e}"
-            results.append((item, False, f"OS error: {e}"))
-            logger.error(f"OS error deleting {item.path}: {e}")
-        except Exception as e:
-            item.status = ItemStatus.FAILED
-            item.failure_reason = str(e)
-            results.append((item, False, str(e)))
-            logger.error(f"Unexpected error deleting {item.path}: {e}", exc_info=True)
+        to_trash.append(item)
+
+    if to_trash:
+        results.extend(_trash_items(to_trash))
 
     return results
 
 
+def _plan_trash_removal(
+    entries: List[os.DirEntry],
+) -> Tuple[List[str], List[str], List[Tuple[str, OSError]]]:
+    """
+    Expand top-level Trash entries into files to unlink and directories
+    to remove. Directories are returned parent-first, so reversing the
+    list yields an order in which every directory is already empty.
+    Symlinks are treated as files and never followed.
+    """
+    files: List[str] = []
+    dirs: List[str] = []
+    errors: List[Tuple[str, OSError]] = []
+    stack: List[str] = []
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            stack.append(entry.path)
+        else:
+            files.append(entry.path)
+
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except (PermissionError, OSError) as e:
+            errors.append((current, e))
+
+    return files, dirs, errors
+
+
+def _unlink(path: str) -> Optional[Tuple[str, OSError]]:
+    try:
+        os.unlink(path)
+    except (PermissionError, OSError) as e:
+        return path, e
+    return None
+
+
+def _remove_trash_entries(entries: List[os.DirEntry]) -> List[Tuple[str, OSError]]:
+    """
+    Remove Trash entries, unlinking files in parallel.
+
+    Unlinks are independent and latency-bound, so a thread pool overlaps
+    them; directories are removed afterwards, deepest first.
+    Returns a list of (path, error) for anything that could not be removed.
+    """
+    files, dirs, errors = _plan_trash_removal(entries)
+
+    if files:
+        with ThreadPoolExecutor(max_workers=TRASH_UNLINK_WORKERS) as pool:
+            errors.extend(err for err in pool.map(_unlink, files) if err)
+
+    for path in reversed(dirs):
+        try:
+            os.rmdir(path)
+        except (PermissionError, OSError) as e:
+            errors.append((path, e))
+
+    return errors
+
+
 def empty_trash() -> Tuple[bool, str]:
     """
     Empty the user's Trash (~/.Trash).
@@ -132,19 +249,17 @@ def empty_trash() -> Tuple[bool, str]:
         return True, "Trash is already empty."
 
     try:
-        item_count = sum(1 for _ in TRASH_PATH.iterdir())
+        with os.scandir(TRASH_PATH) as it:
+            entries = list(it)
+        item_count = len(entries)
         if item_count == 0:
             return True, "Trash is already empty."
 
-        for entry in TRASH_PATH.iterdir():
-            try:
-                if entry.is_dir() and not entry.is_symlink():
-                    shutil.rmtree(str(entry))
-                else:
-                    entry.unlink()
-            except (PermissionError, OSError) as e:
-                logger.error(f"Failed to remove trash item {entry}: {e}")
-                return False, f"Failed to remove some items: {e}"
+        errors = _remove_trash_entries(entries)
+        if errors:
+            for path, e in errors:
+                logger.error(f"Failed to remove trash item {path}: {e}")
+            return False, f"Failed to remove some items: {errors[0][1]}"
 
         logger.info(f"Emptied Trash: {item_count} items removed")
         return True, f"Trash emptied: {item_count} items removed."
@@ -5,10 +5,18 @@ Uses dataclasses for clean, typed data structures.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
+def human_size(size_bytes: int) -> str:
+    """Return a human-readable size string using 1024-based units."""
+    k = min(max(0, (abs(size_bytes).bit_length() - 1) // 10), 5)
+    return f"{size_bytes / (1 << (k * 10)):.1f} {_SIZE_UNITS[k]}"
 
 
 class ScanCategory(Enum):
@@ -35,22 +43,17 @@ class ScanItem:
     path: Path
     category: ScanCategory
     size_bytes: int
-    last_modified: datetime
+    last_modified: float  # POSIX timestamp; formatted only for display/export
     is_symlink: bool = False
     is_directory: bool = False
     status: ItemStatus = ItemStatus.FOUND
     failure_reason: Optional[str] = None
     recommended_action: str = "Review"
 
-    @property
+    @cached_property
     def size_human(self) -> str:
         """Return human-readable size string."""
-        size = self.size_bytes
-        for unit in ("B", "KB", "MB", "GB", "TB"):
-            if abs(size) < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+        return human_size(self.size_bytes)
 
 
 @dataclass
@@ -72,6 +75,20 @@ class ScanSettings:
     scan_trash: bool = True
 
     custom_scan_folders: List[Path] = field(default_factory=list)
+    # Set view of custom_scan_folders for O(1) duplicate checks; the list
+    # keeps the order folders were added in.
+    custom_scan_folders_set: Set[Path] = field(default_factory=set, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.custom_scan_folders_set.update(self.custom_scan_folders)
+
+    def add_custom_folder(self, path: Path) -> bool:
+        """Append a custom scan folder unless already present. Returns True if added."""
+        if path in self.custom_scan_folders_set:
+            return False
+        self.custom_scan_folders_set.add(path)
+        self.custom_scan_folders.append(path)
+        return True
 
 
 @dataclass
@@ -89,9 +106,4 @@ class ScanResult:
 
     @property
     def total_size_human(self) -> str:
-        size = self.total_size
-        for unit in ("B", "KB", "MB", "GB", "TB"):
-            if abs(size) < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
+        return human_size(self.total_size)
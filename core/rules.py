@@ -3,9 +3,14 @@ Safety rules and path constraints for Mac Cleanup Tool.
 
 This module defines which paths are safe to scan, which are blocked,
 and which personal directories require explicit opt-in.
-All path checks use pathlib for consistent cross-platform behavior.
+Blocked and personal prefixes are resolved once at import time into
+component tries, so each check costs a single realpath() plus one dict
+lookup per path component.
 """
 
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 HOME = Path.home()
@@ -78,28 +83,170 @@ APP_LOG_DIR = APP_DATA_DIR / "logs"
 APP_LOG_FILE = APP_LOG_DIR / "app.log"
 
 
-def is_path_blocked(path: Path) -> bool:
-    """Return True if the given path falls under any blocked prefix."""
-    resolved = path.resolve()
-    for prefix in BLOCKED_PATH_PREFIXES:
-        try:
-            resolved.relative_to(prefix.resolve())
+def _with_sep(path_str: str) -> str:
+    """Append a trailing separator so '/usr/bin' never matches '/usr/binx'."""
+    return path_str if path_str.endswith(os.sep) else path_str + os.sep
+
+
+def _prefix_table(paths) -> tuple:
+    """Resolve a list of prefix paths into a tuple of separator-terminated strings."""
+    return tuple(_with_sep(os.path.realpath(str(p))) for p in paths)
+
+
+# Marks a node in a prefix trie where a protected prefix ends. Real path
+# components are always strings, so None can never collide with one.
+_TRIE_LEAF = None
+
+
+def _build_trie(resolved_prefixes) -> dict:
+    """Build a nested-dict trie over the components of resolved prefixes."""
+    trie: dict = {}
+    for prefix in resolved_prefixes:
+        node = trie
+        for part in prefix.rstrip(os.sep).split(os.sep):
+            node = node.setdefault(part, {})
+        node[_TRIE_LEAF] = True
+    return trie
+
+
+def _trie_match(trie: dict, resolved: str) -> bool:
+    """Return True if any prefix in the trie is an ancestor of (or equal to) resolved."""
+    node = trie
+    for part in resolved.rstrip(os.sep).split(os.sep):
+        node = node.get(part)
+        if node is None:
+            return False
+        if _TRIE_LEAF in node:
             return True
-        except ValueError:
-            continue
     return False
 
 
+def _trie_has_descendant(trie: dict, resolved: str) -> bool:
+    """Return True if any prefix in the trie lies strictly below resolved."""
+    node = trie
+    for part in resolved.rstrip(os.sep).split(os.sep):
+        node = node.get(part)
+        if node is None:
+            return False
+    return any(key is not _TRIE_LEAF for key in node)
+
+
+# ---------------------------------------------------------------------------
+# Resolved prefix tables and tries, computed once by _rebuild_tables at
+# import. Per-path results are memoized below, keyed on the raw path string.
+# ---------------------------------------------------------------------------
+_UNDELETABLE_RESOLVED = frozenset(os.path.realpath(p) for p in (str(HOME), os.sep))
+
+
+def _rebuild_tables(blocked_prefixes, personal_paths) -> None:
+    """
+    (Re)compute every lookup table from the given prefix lists and drop
+    memoized decisions. Called once at import; tests call it to point the
+    rules at a temporary tree.
+    """
+    global _BLOCKED_RESOLVED, _PERSONAL_RESOLVED, _BLOCKED_TRIE, _PERSONAL_TRIE
+    global _BLOCKED_RE, _PERSONAL_GATE, _PERSONAL_BELOW_GATE, _FULL_CHECK_NAMES
+
+    _BLOCKED_RESOLVED = _prefix_table(blocked_prefixes)
+    _PERSONAL_RESOLVED = _prefix_table(personal_paths)
+    _BLOCKED_TRIE = _build_trie(_BLOCKED_RESOLVED)
+    _PERSONAL_TRIE = _build_trie(_PERSONAL_RESOLVED)
+
+    # Anchored alternation over every blocked prefix, both as written and as
+    # resolved. A raw path matching it is rejected before realpath() runs.
+    # This can only err towards blocking: a symlink or ".." under a blocked
+    # prefix that would resolve elsewhere is still refused.
+    _BLOCKED_RE = re.compile(
+        "(?:"
+        + "|".join(
+            re.escape(prefix)
+            for prefix in sorted(
+                {str(p).rstrip(os.sep) for p in blocked_prefixes}
+                | {p.rstrip(os.sep) for p in _BLOCKED_RESOLVED}
+            )
+        )
+        + ")(?:" + re.escape(os.sep) + r"|\Z)"
+    )
+
+    # Every resolved personal prefix lies under this directory (normally the
+    # resolved HOME), so a single startswith rejects most paths. The
+    # remainder is matched against a trie of the prefixes relative to the
+    # gate, so the first lookup is on the segment right below HOME
+    # ("Documents", "Library").
+    _PERSONAL_GATE = _with_sep(
+        os.path.commonpath([os.path.dirname(p.rstrip(os.sep)) for p in _PERSONAL_RESOLVED])
+    )
+    _PERSONAL_BELOW_GATE = _build_trie(p[len(_PERSONAL_GATE):] for p in _PERSONAL_RESOLVED)
+
+    # Per-directory scan safety. Everything directly inside a directory
+    # shares its blocked/personal status, except entries that are themselves
+    # symlinks, "." / "..", or that carry the name of a protected root (e.g.
+    # "Documents" inside HOME). Those always get the full check.
+    _FULL_CHECK_NAMES = frozenset(
+        [Path(p).name for p in list(blocked_prefixes) + list(personal_paths)]
+        + [os.path.basename(p.rstrip(os.sep)) for p in _BLOCKED_RESOLVED + _PERSONAL_RESOLVED]
+        + ["", ".", ".."]
+    )
+
+    clear_rule_caches()
+
+
+def _blocked_match(path_str: str, resolved: str) -> bool:
+    """Uncached blocked check on a raw path and its realpath()."""
+    return bool(_BLOCKED_RE.match(path_str)) or _trie_match(_BLOCKED_TRIE, resolved)
+
+
+@lru_cache(maxsize=65536)
+def _is_blocked_str(path_str: str) -> bool:
+    if _BLOCKED_RE.match(path_str):
+        return True
+    return _trie_match(_BLOCKED_TRIE, os.path.realpath(path_str))
+
+
+def _personal_match(resolved: str) -> bool:
+    """Uncached personal check on an already resolved path."""
+    if not resolved.startswith(_PERSONAL_GATE):
+        return False
+    return _trie_match(_PERSONAL_BELOW_GATE, resolved[len(_PERSONAL_GATE):])
+
+
+@lru_cache(maxsize=65536)
+def _is_personal_str(path_str: str) -> bool:
+    return _personal_match(os.path.realpath(path_str))
+
+
+def is_path_blocked(path: Path) -> bool:
+    """Return True if the given path falls under any blocked prefix."""
+    return _is_blocked_str(os.fspath(path))
+
+
+def is_path_blocked_str(path_str: str) -> bool:
+    """String form of is_path_blocked, for callers that hold DirEntry.path."""
+    return _is_blocked_str(path_str)
+
+
 def is_path_in_personal_docs(path: Path) -> bool:
     """Return True if the path falls under a personal document directory."""
-    resolved = path.resolve()
-    for personal in PERSONAL_DOC_PATHS:
-        try:
-            resolved.relative_to(personal.resolve())
-            return True
-        except ValueError:
-            continue
-    return False
+    return _is_personal_str(os.fspath(path))
+
+
+@lru_cache(maxsize=65536)
+def _scan_safety(path_str: str, allow_personal: bool) -> bool:
+    if _is_blocked_str(path_str):
+        return False
+    if not allow_personal and _is_personal_str(path_str):
+        return False
+    return True
+
+
+def clear_rule_caches() -> None:
+    """Drop memoized safety decisions, e.g. after scan folders change."""
+    _is_blocked_str.cache_clear()
+    _is_personal_str.cache_clear()
+    _scan_safety.cache_clear()
+
+
+_rebuild_tables(BLOCKED_PATH_PREFIXES, PERSONAL_DOC_PATHS)
 
 
 def is_path_safe_for_scan(path: Path, allow_personal: bool = False) -> bool:
@@ -109,26 +256,47 @@ def is_path_safe_for_scan(path: Path, allow_personal: bool = False) -> bool:
     A path is safe if:
       1. It is NOT under any blocked prefix.
       2. It is NOT a personal doc path (unless allow_personal is True).
+
+    Results are cached per parent directory, so sibling files cost one
+    lookup after the first.
     """
-    if is_path_blocked(path):
-        return False
-    if not allow_personal and is_path_in_personal_docs(path):
-        return False
-    return True
+    return is_path_safe_for_scan_str(os.fspath(path), allow_personal)
+
+
+def is_path_safe_for_scan_str(path_str: str, allow_personal: bool = False) -> bool:
+    """String form of is_path_safe_for_scan, for callers that hold DirEntry.path."""
+    dirpath, name = os.path.split(path_str)
+    if name in _FULL_CHECK_NAMES or os.path.islink(path_str):
+        return _scan_safety(path_str, allow_personal)
+    return _scan_safety(dirpath, allow_personal)
+
+
+def contains_protected_paths(root: Path, allow_personal: bool = False) -> bool:
+    """
+    Return True if a blocked (or, unless allowed, personal) prefix lies
+    strictly inside root. Walks of roots without any can skip per-entry
+    safety checks for everything that is not a symlink.
+    """
+    resolved = os.path.realpath(os.fspath(root))
+    if _trie_has_descendant(_BLOCKED_TRIE, resolved):
+        return True
+    return not allow_personal and _trie_has_descendant(_PERSONAL_TRIE, resolved)
 
 
 def is_path_safe_for_deletion(path: Path, allow_personal: bool = False) -> bool:
     """
     Check whether a path is safe to delete.
-    Uses the same rules as scanning, plus additional checks.
+    Uses the same rules as scanning, plus additional checks. Never cached.
     """
-    if is_path_blocked(path):
-        return False
-    if not allow_personal and is_path_in_personal_docs(path):
-        return False
-    resolved = path.resolve()
-    if resolved == HOME.resolve():
+    return _deletion_safety(os.fspath(path), allow_personal)
+
+
+def _deletion_safety(path_str: str, allow_personal: bool) -> bool:
+    # Deliberately bypasses the scan caches: the path is resolved afresh,
+    # so a symlink swapped since the scan cannot reuse a stale answer.
+    resolved = os.path.realpath(path_str)
+    if _blocked_match(path_str, resolved):
         return False
-    if resolved == Path("/").resolve():
+    if not allow_personal and _personal_match(resolved):
         return False
-    return True
+    return resolved not in _UNDELETABLE_RESOLVED
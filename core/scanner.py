@@ -3,28 +3,41 @@ Scanning orchestration for Mac Cleanup Tool.
 
 Provides threaded scanning with progress callbacks and cancellation support.
 Each scan type (large files, caches, downloads, logs, trash) is implemented
-as a separate method for clarity and safety.
+as a separate method for clarity and safety. Enabled scan types run
+concurrently on daemon threads, since they are I/O-latency bound.
+Accepted items are also streamed through a queue so the UI can show them
+before the scan finishes.
 """
 
+import heapq
 import logging
+import os
+import queue
 import time
 import threading
-from datetime import datetime, timedelta
+from concurrent.futures import Future, wait
 from pathlib import Path
-from typing import Callable, Optional, List
+from typing import Callable, Optional, List, Tuple, Union
 
 from core.models import ScanCategory, ScanItem, ScanResult, ScanSettings
 from core.rules import (
     SAFE_PATHS,
     TRASH_PATH,
-    is_path_blocked,
+    clear_rule_caches,
+    contains_protected_paths,
     is_path_safe_for_scan,
+    is_path_safe_for_scan_str,
     HOME,
 )
-from core.utils import get_directory_size
+from core.utils import get_directory_size, get_entry_size, iter_tree
 
 logger = logging.getLogger("mac_cleanup")
 
+MAX_SCAN_WORKERS = 8
+ITEM_QUEUE_SIZE = 1024
+SECONDS_PER_DAY = 86400
+PROGRESS_INTERVAL_S = 0.1
+
 
 class Scanner:
     """
@@ -40,6 +53,10 @@ class Scanner:
         self._lock = threading.Lock()
         self._progress_callback: Optional[Callable[[str, int], None]] = None
         self._items_found = 0
+        self._last_progress_t = 0.0
+        self._heap: List[Tuple[int, int, ScanItem]] = []
+        self._seq = 0
+        self._item_queue: "queue.Queue[ScanItem]" = queue.Queue(maxsize=ITEM_QUEUE_SIZE)
 
     def cancel(self):
         """Request cancellation of the current scan."""
@@ -51,44 +68,120 @@ class Scanner:
         with self._lock:
             return self._cancelled
 
+    @property
+    def item_queue(self) -> "queue.Queue[ScanItem]":
+        """
+        Queue of items as they are accepted, for progressive display.
+        Best-effort: if the consumer falls behind, items are still kept in
+        the final ScanResult but may be missing from the queue.
+        """
+        return self._item_queue
+
     def set_progress_callback(self, callback: Callable[[str, int], None]):
         """Set a callback for progress updates: callback(current_path, items_found)."""
         self._progress_callback = callback
 
-    def _report_progress(self, current_path: str):
-        """Report current scanning progress to the UI."""
-        if self._progress_callback:
-            self._progress_callback(current_path, self._items_found)
+    def _report_progress(self, current_path: Union[str, os.PathLike]):
+        """
+        Report current scanning progress to the UI, at most once per
+        PROGRESS_INTERVAL_S. The path is only stringified when reported.
+        """
+        if self._progress_callback is None:
+            return
+        now = time.monotonic()
+        if now - self._last_progress_t < PROGRESS_INTERVAL_S:
+            return
+        self._last_progress_t = now
+        self._progress_callback(str(current_path), self._items_found)
+
+    @property
+    def _size_floor(self) -> int:
+        """
+        Size an item must exceed to enter the top max_results, or -1 while
+        there is still room. Reads without the lock; a stale value only
+        means an item is offered to _emit and rejected there.
+        """
+        heap = self._heap
+        if not heap or len(heap) < self.settings.max_results:
+            return -1
+        return heap[0][0]
+
+    def _emit(self, result: ScanResult, scan_item: ScanItem, ignore_limit: bool = False) -> bool:
+        """
+        Offer an item to the shared top-max_results-by-size heap and, if it
+        is kept, publish it on the item queue. Items passed with
+        ignore_limit bypass the heap and go straight into the worker's
+        result. Safe to call from concurrent scan workers.
+        """
+        if ignore_limit:
+            with self._lock:
+                self._items_found += 1
+            result.items.append(scan_item)
+        else:
+            with self._lock:
+                # Ties go to the item found first: later items sort lower.
+                self._seq += 1
+                entry = (scan_item.size_bytes, -self._seq, scan_item)
+                heap = self._heap
+                if len(heap) < self.settings.max_results:
+                    heapq.heappush(heap, entry)
+                    self._items_found += 1
+                elif heap and entry > heap[0]:
+                    heapq.heapreplace(heap, entry)
+                else:
+                    return False
+        try:
+            self._item_queue.put_nowait(scan_item)
+        except queue.Full:
+            pass
+        return True
 
     def scan(self) -> ScanResult:
         """
         Run all enabled scans and return aggregated results.
         This method is meant to be called from a background thread.
+
+        Each scan type runs in a worker thread and offers its items to a
+        shared heap that keeps the max_results largest. Once all have
+        finished, the kept items are returned largest first, followed by
+        items that bypass the limit (the Trash summary).
         """
         start_time = time.time()
         result = ScanResult()
+        # Safety decisions are memoized per path; start each scan from a
+        # clean slate so symlinks changed since the last run are re-resolved.
+        clear_rule_caches()
         self._cancelled = False
         self._items_found = 0
-
-        try:
-            if self.settings.scan_large_files and not self.is_cancelled:
-                self._scan_large_files(result)
-
-            if self.settings.scan_caches and not self.is_cancelled:
-                self._scan_caches(result)
-
-            if self.settings.scan_downloads and not self.is_cancelled:
-                self._scan_old_downloads(result)
-
-            if self.settings.scan_logs and not self.is_cancelled:
-                self._scan_logs(result)
-
-            if self.settings.scan_trash and not self.is_cancelled:
-                self._scan_trash(result)
-
-        except Exception as e:
-            logger.error(f"Scan error: {e}", exc_info=True)
-            result.errors.append(str(e))
+        self._last_progress_t = 0.0
+        self._heap = []
+        self._seq = 0
+
+        scans = [
+            (self.settings.scan_large_files, self._scan_large_files),
+            (self.settings.scan_caches, self._scan_caches),
+            (self.settings.scan_downloads, self._scan_old_downloads),
+            (self.settings.scan_logs, self._scan_logs),
+            (self.settings.scan_trash, self._scan_trash),
+        ]
+        tasks = [func for enabled, func in scans if enabled]
+
+        if tasks:
+            partials = [ScanResult() for _ in tasks]
+            workers = min(len(tasks), MAX_SCAN_WORKERS, os.cpu_count() or 1)
+            slots = threading.BoundedSemaphore(workers)
+            futures = [self._start_task(func, part, slots) for func, part in zip(tasks, partials)]
+            wait(futures)
+
+            result.items = [item for _, _, item in sorted(self._heap, reverse=True)]
+            for future, part in zip(futures, partials):
+                result.items.extend(part.items)
+                result.errors.extend(part.errors)
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Scan error: {e}", exc_info=True)
+                    result.errors.append(str(e))
 
         result.scan_duration_seconds = time.time() - start_time
         result.was_cancelled = self.is_cancelled
@@ -101,6 +194,26 @@ class Scanner:
         )
         return result
 
+    @staticmethod
+    def _start_task(func, part: ScanResult, slots: threading.BoundedSemaphore) -> Future:
+        """
+        Run func(part) on a daemon thread once a slot is free and return a
+        Future for it. Unlike a ThreadPoolExecutor worker, a daemon thread
+        is not joined at interpreter exit, so quitting mid-scan never waits
+        for a long directory sizing call to finish.
+        """
+        future: Future = Future()
+
+        def worker():
+            with slots:
+                try:
+                    future.set_result(func(part))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        threading.Thread(target=worker, name="scan", daemon=True).start()
+        return future
+
     def _scan_large_files(self, result: ScanResult):
         """Scan for large files in safe default locations and custom folders."""
         logger.info("Scanning for large files...")
@@ -124,49 +237,67 @@ class Scanner:
             self._walk_for_large_files(root, threshold, result)
 
     def _walk_for_large_files(self, root: Path, threshold: int, result: ScanResult):
-        """Walk a directory tree looking for files above the size threshold."""
-        try:
-            iterator = root.rglob("*") if root.is_dir() else [root]
-        except (PermissionError, OSError) as e:
-            logger.warning(f"Cannot access {root}: {e}")
+        """
+        Walk a directory tree looking for files above the size threshold.
+
+        Progress is reported once per directory. Among files, the integer
+        size compare runs first since it rejects nearly every entry; name,
+        symlink and safety checks only run for candidates.
+        Once max_results items are held, files no larger than the smallest
+        of them are rejected by the same compare.
+        The root is checked once; descendants are only re-checked when they
+        are followed symlinks or the root contains protected paths.
+        """
+        follow_symlinks = self.settings.follow_symlinks
+        include_hidden = self.settings.include_hidden_files
+        allow_personal = self.settings.allow_personal_docs
+
+        if not is_path_safe_for_scan(root, allow_personal):
+            logger.warning(f"Skipped unsafe scan root: {root}")
             return
+        check_each = contains_protected_paths(root, allow_personal)
 
-        for item_path in iterator:
+        for entry, stat in iter_tree(root, follow_symlinks):
             if self.is_cancelled:
                 return
-            if len(result.items) >= self.settings.max_results:
-                return
+
+            # Report before the size filter rejects the entry, otherwise
+            # progress stalls across trees with no large files.
+            if entry.is_dir(follow_symlinks=False):
+                self._report_progress(entry.path)
+                continue
+
+            if stat.st_size < threshold or stat.st_size <= self._size_floor:
+                continue
 
             try:
-                if item_path.is_symlink():
-                    if not self.settings.follow_symlinks:
-                        continue
+                if entry.name[0] == "." and not include_hidden:
+                    continue
 
-                if not item_path.name.startswith(".") or self.settings.include_hidden_files:
-                    pass
-                else:
+                is_symlink = entry.is_symlink()
+                if is_symlink and not follow_symlinks:
                     continue
 
-                if not is_path_safe_for_scan(item_path, self.settings.allow_personal_docs):
+                if not entry.is_file():
                     continue
 
-                if item_path.is_file():
-                    stat = item_path.stat(follow_symlinks=self.settings.follow_symlinks)
-                    if stat.st_size >= threshold:
-                        self._report_progress(str(item_path))
-                        scan_item = ScanItem(
-                            path=item_path,
-                            category=ScanCategory.LARGE_FILE,
-                            size_bytes=stat.st_size,
-                            last_modified=datetime.fromtimestamp(stat.st_mtime),
-                            is_symlink=item_path.is_symlink(),
-                            recommended_action="Review — large file",
-                        )
-                        result.items.append(scan_item)
-                        self._items_found += 1
+                if (check_each or is_symlink) and not is_path_safe_for_scan_str(
+                    entry.path, allow_personal
+                ):
+                    continue
+
+                scan_item = ScanItem(
+                    path=Path(entry.path),
+                    category=ScanCategory.LARGE_FILE,
+                    size_bytes=stat.st_size,
+                    last_modified=stat.st_mtime,
+                    is_symlink=is_symlink,
+                    recommended_action="Review — large file",
+                )
+                self._emit(result, scan_item)
 
             except (PermissionError, OSError) as e:
-                logger.debug(f"Skipped {item_path}: {e}")
+                logger.debug(f"Skipped {entry.path}: {e}")
                 continue
 
     def _scan_caches(self, result: ScanResult):
@@ -176,48 +307,49 @@ class Scanner:
         if not cache_dir.exists():
             return
 
-        age_cutoff = datetime.now() - timedelta(days=self.settings.cache_age_days)
+        age_cutoff = time.time() - self.settings.cache_age_days * SECONDS_PER_DAY
+        follow_symlinks = self.settings.follow_symlinks
 
         try:
-            for entry in cache_dir.iterdir():
-                if self.is_cancelled:
-                    return
-                if len(result.items) >= self.settings.max_results:
-                    return
-
-                try:
-                    if entry.is_symlink() and not self.settings.follow_symlinks:
-                        continue
-
-                    self._report_progress(str(entry))
-
-                    if entry.is_dir():
-                        size = get_directory_size(entry, self.settings.follow_symlinks)
-                        mtime = datetime.fromtimestamp(entry.stat().st_mtime)
-                    elif entry.is_file():
-                        stat = entry.stat()
-                        size = stat.st_size
-                        mtime = datetime.fromtimestamp(stat.st_mtime)
-                    else:
+            with os.scandir(cache_dir) as it:
+                for entry in it:
+                    if self.is_cancelled:
+                        return
+
+                    try:
+                        is_symlink = entry.is_symlink()
+                        if is_symlink and not follow_symlinks:
+                            continue
+
+                        self._report_progress(entry.path)
+
+                        is_dir = entry.is_dir()
+                        if is_dir:
+                            size = get_directory_size(Path(entry.path), follow_symlinks)
+                            mtime = entry.stat(follow_symlinks=follow_symlinks).st_mtime
+                        elif entry.is_file():
+                            stat = entry.stat(follow_symlinks=follow_symlinks)
+                            size = stat.st_size
+                            mtime = stat.st_mtime
+                        else:
+                            continue
+
+                        if size > 0 and mtime < age_cutoff:
+                            scan_item = ScanItem(
+                                path=Path(entry.path),
+                                category=ScanCategory.CACHE,
+                                size_bytes=size,
+                                last_modified=mtime,
+                                is_symlink=is_symlink,
+                                is_directory=is_dir,
+                                recommended_action="Safe to remove — app cache",
+                            )
+                            self._emit(result, scan_item)
+
+                    except (PermissionError, OSError) as e:
+                        logger.debug(f"Skipped cache entry {entry.path}: {e}")
                         continue
 
-                    if size > 0 and mtime < age_cutoff:
-                        scan_item = ScanItem(
-                            path=entry,
-                            category=ScanCategory.CACHE,
-                            size_bytes=size,
-                            last_modified=mtime,
-                            is_symlink=entry.is_symlink(),
-                            is_directory=entry.is_dir(),
-                            recommended_action="Safe to remove — app cache",
-                        )
-                        result.items.append(scan_item)
-                        self._items_found += 1
-
-                except (PermissionError, OSError) as e:
-                    logger.debug(f"Skipped cache entry {entry}: {e}")
-                    continue
-
         except (PermissionError, OSError) as e:
             logger.warning(f"Cannot read cache dir: {e}")
 
@@ -228,45 +360,47 @@ class Scanner:
         if not downloads_dir.exists():
             return
 
-        age_cutoff = datetime.now() - timedelta(days=self.settings.old_downloads_days)
+        age_cutoff = time.time() - self.settings.old_downloads_days * SECONDS_PER_DAY
+        follow_symlinks = self.settings.follow_symlinks
+        action = f"Old download (>{self.settings.old_downloads_days} days)"
 
         try:
-            for entry in downloads_dir.iterdir():
-                if self.is_cancelled:
-                    return
-                if len(result.items) >= self.settings.max_results:
-                    return
-
-                try:
-                    if entry.is_symlink() and not self.settings.follow_symlinks:
+            with os.scandir(downloads_dir) as it:
+                for entry in it:
+                    if self.is_cancelled:
+                        return
+
+                    try:
+                        is_symlink = entry.is_symlink()
+                        if is_symlink and not follow_symlinks:
+                            continue
+
+                        self._report_progress(entry.path)
+                        stat = entry.stat(follow_symlinks=follow_symlinks)
+                        mtime = stat.st_mtime
+
+                        if mtime < age_cutoff:
+                            is_dir = entry.is_dir()
+                            if is_dir:
+                                size = get_directory_size(Path(entry.path), follow_symlinks)
+                            else:
+                                size = stat.st_size
+
+                            scan_item = ScanItem(
+                                path=Path(entry.path),
+                                category=ScanCategory.OLD_DOWNLOAD,
+                                size_bytes=size,
+                                last_modified=mtime,
+                                is_symlink=is_symlink,
+                                is_directory=is_dir,
+                                recommended_action=action,
+                            )
+                            self._emit(result, scan_item)
+
+                    except (PermissionError, OSError) as e:
+                        logger.debug(f"Skipped download entry {entry.path}: {e}")
                         continue
 
-                    self._report_progress(str(entry))
-                    stat = entry.stat(follow_symlinks=self.settings.follow_symlinks)
-                    mtime = datetime.fromtimestamp(stat.st_mtime)
-
-                    if mtime < age_cutoff:
-                        if entry.is_dir():
-                            size = get_directory_size(entry, self.settings.follow_symlinks)
-                        else:
-                            size = stat.st_size
-
-                        scan_item = ScanItem(
-                            path=entry,
-                            category=ScanCategory.OLD_DOWNLOAD,
-                            size_bytes=size,
-                            last_modified=mtime,
-                            is_symlink=entry.is_symlink(),
-                            is_directory=entry.is_dir(),
-                            recommended_action=f"Old download (>{self.settings.old_downloads_days} days)",
-                        )
-                        result.items.append(scan_item)
-                        self._items_found += 1
-
-                except (PermissionError, OSError) as e:
-                    logger.debug(f"Skipped download entry {entry}: {e}")
-                    continue
-
         except (PermissionError, OSError) as e:
             logger.warning(f"Cannot read downloads dir: {e}")
 
@@ -277,42 +411,37 @@ class Scanner:
         if not logs_dir.exists():
             return
 
-        age_cutoff = datetime.now() - timedelta(days=self.settings.cache_age_days)
+        age_cutoff = time.time() - self.settings.cache_age_days * SECONDS_PER_DAY
+        follow_symlinks = self.settings.follow_symlinks
 
-        try:
-            for entry in logs_dir.rglob("*"):
-                if self.is_cancelled:
-                    return
-                if len(result.items) >= self.settings.max_results:
-                    return
-
-                try:
-                    if entry.is_symlink() and not self.settings.follow_symlinks:
-                        continue
-                    if not entry.is_file():
-                        continue
+        # iter_tree is lazy, so returning on cancel stops reading
+        # directories that have not been opened yet.
+        for entry, stat in iter_tree(logs_dir, follow_symlinks):
+            if self.is_cancelled:
+                return
 
-                    self._report_progress(str(entry))
-                    stat = entry.stat()
-                    mtime = datetime.fromtimestamp(stat.st_mtime)
-
-                    if mtime < age_cutoff and stat.st_size > 0:
-                        scan_item = ScanItem(
-                            path=entry,
-                            category=ScanCategory.LOG_FILE,
-                            size_bytes=stat.st_size,
-                            last_modified=mtime,
-                            recommended_action="Safe to remove — old log file",
-                        )
-                        result.items.append(scan_item)
-                        self._items_found += 1
-
-                except (PermissionError, OSError) as e:
-                    logger.debug(f"Skipped log entry {entry}: {e}")
+            try:
+                if entry.is_symlink() and not follow_symlinks:
+                    continue
+                if not entry.is_file():
                     continue
 
-        except (PermissionError, OSError) as e:
-            logger.warning(f"Cannot read logs dir: {e}")
+                self._report_progress(entry.path)
+                mtime = stat.st_mtime
+
+                if mtime < age_cutoff and stat.st_size > 0:
+                    scan_item = ScanItem(
+                        path=Path(entry.path),
+                        category=ScanCategory.LOG_FILE,
+                        size_bytes=stat.st_size,
+                        last_modified=mtime,
+                        recommended_action="Safe to remove — old log file",
+                    )
+                    self._emit(result, scan_item)
+
+            except (PermissionError, OSError) as e:
+                logger.debug(f"Skipped log entry {entry.path}: {e}")
+                continue
 
     def _scan_trash(self, result: ScanResult):
         """Report the size of ~/.Trash without deleting anything."""
@@ -320,23 +449,28 @@ class Scanner:
         if not TRASH_PATH.exists():
             return
 
-        self._report_progress(str(TRASH_PATH))
+        self._report_progress(TRASH_PATH)
 
         try:
-            total_size = get_directory_size(TRASH_PATH, follow_symlinks=False)
-            item_count = sum(1 for _ in TRASH_PATH.iterdir())
+            total_size = 0
+            item_count = 0
+            with os.scandir(TRASH_PATH) as it:
+                for entry in it:
+                    if self.is_cancelled:
+                        return
+                    item_count += 1
+                    total_size += get_entry_size(entry)
 
             if total_size > 0:
                 scan_item = ScanItem(
                     path=TRASH_PATH,
                     category=ScanCategory.TRASH,
                     size_bytes=total_size,
-                    last_modified=datetime.fromtimestamp(TRASH_PATH.stat().st_mtime),
+                    last_modified=TRASH_PATH.stat().st_mtime,
                     is_directory=True,
                     recommended_action=f"Trash contains {item_count} items — use Empty Trash",
                 )
-                result.items.append(scan_item)
-                self._items_found += 1
+                self._emit(result, scan_item, ignore_limit=True)
 
         except (PermissionError, OSError) as e:
             logger.warning(f"Cannot read Trash: {e}")
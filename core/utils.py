@@ -5,21 +5,31 @@ Provides size formatting, time formatting, CSV export, and logging setup.
 """
 
 import csv
+import functools
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
 
-from core.models import ScanItem
+from core.models import ScanItem, human_size
 from core.rules import APP_LOG_DIR, APP_LOG_FILE
 
+try:
+    from core import _fastwalk
+    HAS_FASTWALK = True
+except ImportError:
+    _fastwalk = None
+    HAS_FASTWALK = False
+
 
 def setup_logging() -> logging.Logger:
     """
     Set up application logging to file and console.
     Logs are stored in ~/.mac_cleanup_tool/logs/app.log
     """
-    APP_LOG_DIR.mkdir(parents=True, exist_ok=True)
+    if not os.path.isdir(APP_LOG_DIR):
+        APP_LOG_DIR.mkdir(parents=True, exist_ok=True)
 
     logger = logging.getLogger("mac_cleanup")
     logger.setLevel(logging.DEBUG)
@@ -43,41 +53,87 @@ def setup_logging() -> logging.Logger:
     return logger
 
 
+@functools.lru_cache(maxsize=4096)
 def format_size(size_bytes: int) -> str:
     """Convert bytes to a human-readable string."""
     if size_bytes < 0:
         return "0 B"
-    size: float = float(size_bytes)
-    for unit in ("B", "KB", "MB", "GB", "TB"):
-        if abs(size) < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
-    return f"{size:.1f} PB"
+    return human_size(size_bytes)
+
 
+def format_timestamp(timestamp: float) -> str:
+    """Format a POSIX timestamp for display."""
+    return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
 
-def format_timestamp(dt: datetime) -> str:
-    """Format a datetime for display."""
-    return dt.strftime("%Y-%m-%d %H:%M")
+
+def iter_tree(
+    root: Path, follow_symlinks: bool = False
+) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+    """
+    Walk a directory tree with os.scandir, yielding (entry, stat) pairs.
+
+    Uses an explicit stack instead of recursion and reuses the type
+    information cached on each DirEntry, so every entry costs far
+    fewer syscalls than Path.rglob(). Symlinked directories are never
+    descended into; unreadable directories and entries are skipped.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        st = entry.stat(follow_symlinks=follow_symlinks)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except (PermissionError, OSError):
+                        continue
+                    yield entry, st
+        except (PermissionError, OSError):
+            continue
 
 
 def get_directory_size(path: Path, follow_symlinks: bool = False) -> int:
     """
     Calculate total size of a directory recursively.
     Skips symlinks by default to avoid loops and unintended traversal.
+    Uses the compiled fts(3) walker when available, which releases the GIL.
     """
+    if HAS_FASTWALK:
+        return _fastwalk.dir_size(os.fsencode(path), follow_symlinks)
+
     total = 0
-    try:
-        for item in path.rglob("*"):
-            try:
-                if item.is_symlink() and not follow_symlinks:
-                    continue
-                if item.is_file():
-                    total += item.stat(follow_symlinks=follow_symlinks).st_size
-            except (PermissionError, OSError):
+    for entry, st in iter_tree(path, follow_symlinks):
+        try:
+            if entry.is_symlink() and not follow_symlinks:
                 continue
+            if entry.is_file():
+                total += st.st_size
+        except (PermissionError, OSError):
+            continue
+    return total
+
+
+def get_entry_size(entry: os.DirEntry, follow_symlinks: bool = False) -> int:
+    """
+    Return the size of a single os.scandir entry: the file size for files,
+    or the recursive size for directories. Symlinks count as 0 unless
+    follow_symlinks is set; unreadable entries count as 0.
+    """
+    try:
+        if entry.is_symlink() and not follow_symlinks:
+            return 0
+        if entry.is_dir(follow_symlinks=False):
+            return get_directory_size(Path(entry.path), follow_symlinks)
+        if entry.is_file():
+            return entry.stat(follow_symlinks=follow_symlinks).st_size
     except (PermissionError, OSError):
         pass
-    return total
+    return 0
+
+
+CSV_WRITE_BUFFER = 1 << 20
 
 
 def export_to_csv(items: List[ScanItem], output_path: Path) -> None:
@@ -87,7 +143,7 @@ def export_to_csv(items: List[ScanItem], output_path: Path) -> None:
     Columns: timestamp, category, size_bytes, size_human,
              last_modified, path, recommended_action, selected
     """
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER) as f:
         writer = csv.writer(f)
         writer.writerow([
             "timestamp",
@@ -100,8 +156,8 @@ def export_to_csv(items: List[ScanItem], output_path: Path) -> None:
             "status",
         ])
         now = datetime.now().isoformat()
-        for item in items:
-            writer.writerow([
+        writer.writerows(
+            (
                 now,
                 item.category.value,
                 item.size_bytes,
@@ -110,4 +166,6 @@ def export_to_csv(items: List[ScanItem], output_path: Path) -> None:
                 str(item.path),
                 item.recommended_action,
                 item.status.value,
-            ])
+            )
+            for item in items
+        )
@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+class TempDirTestCase(unittest.TestCase):
+    """TestCase with a fresh temporary directory at self.tmp for each test."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        # Resolved, so paths compare equal to what realpath() returns.
+        self.tmp = Path(os.path.realpath(tmp.name))
+
+    def patch(self, target, attribute: str, value):
+        """Replace target.attribute with value until the test ends."""
+        patcher = mock.patch.object(target, attribute, value)
+        patcher.start()
+        self.addCleanup(patcher.stop)
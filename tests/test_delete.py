@@ -0,0 +1,129 @@
+"""
+Unit tests for deletion and Trash emptying.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+from core import delete
+from core.models import ItemStatus, ScanCategory, ScanItem
+from tests.support import TempDirTestCase
+
+
+class TestDeleteItems(TempDirTestCase):
+    """Test batching and fallback when moving items to Trash."""
+
+    def setUp(self):
+        super().setUp()
+        self.items = []
+        for name in ("a.log", "b.log", "c.log"):
+            path = self.tmp / name
+            path.write_text("x")
+            self.items.append(ScanItem(path, ScanCategory.LOG_FILE, 1, 0.0))
+        self.patch(delete, "is_path_safe_for_deletion", mock.Mock(return_value=True))
+        self.patch(delete, "HAS_SEND2TRASH", True)
+
+    def test_dry_run_touches_nothing(self):
+        trash = mock.Mock()
+        with mock.patch.object(delete, "_send2trash_func", trash):
+            results = delete.delete_items(self.items, dry_run=True)
+        trash.assert_not_called()
+        self.assertTrue(all(ok for _, ok, _ in results))
+        self.assertTrue(all(item.status == ItemStatus.SKIPPED for item in self.items))
+
+    def test_single_batch_call(self):
+        trash = mock.Mock()
+        with mock.patch.object(delete, "_send2trash_func", trash):
+            results = delete.delete_items(self.items, dry_run=False)
+        trash.assert_called_once_with([str(item.path) for item in self.items])
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(item.status == ItemStatus.TRASHED for item in self.items))
+
+    def test_batch_failure_retries_individually(self):
+        def trash(paths):
+            if isinstance(paths, list):
+                os.unlink(paths[0])
+                raise OSError("batch failed")
+            if paths.endswith("c.log"):
+                raise PermissionError("denied")
+            os.unlink(paths)
+
+        with mock.patch.object(delete, "_send2trash_func", trash):
+            results = delete.delete_items(self.items, dry_run=False)
+
+        outcomes = {item.path.name: ok for item, ok, _ in results}
+        self.assertEqual(outcomes, {"a.log": True, "b.log": True, "c.log": False})
+        self.assertEqual(self.items[2].status, ItemStatus.FAILED)
+
+
+class TestTrashFallback(TempDirTestCase):
+    """Test the manual move-to-Trash fallback."""
+
+    def setUp(self):
+        super().setUp()
+        self.trash = self.tmp / ".Trash"
+        self.trash.mkdir()
+        self.source = self.tmp / "src"
+        self.source.mkdir()
+        self.patch(delete, "TRASH_PATH", self.trash)
+
+    def test_name_conflict_gets_unique_suffix(self):
+        (self.trash / "report.txt").write_text("old")
+        path = self.source / "report.txt"
+        path.write_text("new")
+
+        delete._move_to_trash_fallback(path)
+
+        self.assertFalse(path.exists())
+        names = sorted(os.listdir(self.trash))
+        self.assertEqual(len(names), 2)
+        self.assertIn("report.txt", names)
+        moved = next(n for n in names if n != "report.txt")
+        self.assertRegex(moved, r"^report_[0-9a-f]{8}\.txt$")
+        self.assertEqual((self.trash / moved).read_text(), "new")
+
+
+class TestEmptyTrash(TempDirTestCase):
+    """Test that empty_trash removes everything inside the Trash only."""
+
+    def setUp(self):
+        super().setUp()
+        self.trash = self.tmp / ".Trash"
+        self.trash.mkdir()
+        self.outside = self.tmp / "keep"
+        self.outside.mkdir()
+        (self.outside / "important.txt").write_text("keep me")
+        self.patch(delete, "TRASH_PATH", self.trash)
+
+    def test_missing_trash_is_empty(self):
+        self.trash.rmdir()
+        self.assertEqual(delete.empty_trash(), (True, "Trash is already empty."))
+
+    def test_empty_trash_is_empty(self):
+        self.assertEqual(delete.empty_trash(), (True, "Trash is already empty."))
+
+    def test_removes_nested_tree(self):
+        (self.trash / "a.txt").write_text("a")
+        nested = self.trash / "dir" / "sub"
+        nested.mkdir(parents=True)
+        for i in range(50):
+            (nested / f"f{i}").write_text("x")
+
+        ok, message = delete.empty_trash()
+
+        self.assertTrue(ok)
+        self.assertEqual(message, "Trash emptied: 2 items removed.")
+        self.assertEqual(os.listdir(self.trash), [])
+
+    def test_symlinked_dir_not_followed(self):
+        os.symlink(self.outside, self.trash / "link")
+
+        ok, _ = delete.empty_trash()
+
+        self.assertTrue(ok)
+        self.assertTrue((self.outside / "important.txt").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
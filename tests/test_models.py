@@ -0,0 +1,31 @@
+"""
+Unit tests for the data models.
+"""
+
+import unittest
+from pathlib import Path
+
+from core.models import ScanSettings
+
+
+class TestCustomFolders(unittest.TestCase):
+    """Test the ordered, de-duplicated custom scan folder list."""
+
+    def test_add_keeps_order_and_skips_duplicates(self):
+        settings = ScanSettings()
+        self.assertTrue(settings.add_custom_folder(Path("/a")))
+        self.assertTrue(settings.add_custom_folder(Path("/b")))
+        self.assertFalse(settings.add_custom_folder(Path("/a")))
+        self.assertEqual(settings.custom_scan_folders, [Path("/a"), Path("/b")])
+
+    def test_initial_folders_are_indexed(self):
+        settings = ScanSettings(custom_scan_folders=[Path("/a")])
+        self.assertFalse(settings.add_custom_folder(Path("/a")))
+        self.assertEqual(settings.custom_scan_folders, [Path("/a")])
+
+    def test_set_ignored_for_equality(self):
+        self.assertEqual(ScanSettings(), ScanSettings())
+
+
+if __name__ == "__main__":
+    unittest.main()
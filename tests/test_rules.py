@@ -2,47 +2,54 @@
 Unit tests for safety rules and path blocking logic.
 """
 
+import os
 import unittest
 from pathlib import Path
 
+from core import rules
 from core.rules import (
     HOME,
     BLOCKED_PATH_PREFIXES,
     SAFE_PATHS,
     PERSONAL_DOC_PATHS,
     is_path_blocked,
+    is_path_blocked_str,
     is_path_in_personal_docs,
     is_path_safe_for_scan,
+    is_path_safe_for_scan_str,
     is_path_safe_for_deletion,
+    contains_protected_paths,
 )
+from tests.support import TempDirTestCase
 
 
 class TestBlockedPaths(unittest.TestCase):
     """Test that system and critical paths are always blocked."""
 
+    BLOCKED = (
+        Path("/System/Library/something"),
+        Path("/bin/bash"),
+        Path("/sbin/fsck"),
+        Path("/usr/bin/python"),
+        Path("/usr/lib/libSystem.B.dylib"),
+        Path("/Library/Application Support/something"),
+        Path("/private/var/log/something"),
+    )
+    SAFE = (
+        HOME / "Library" / "Caches" / "com.example.app",
+        HOME / "Library" / "Logs" / "old.log",
+        HOME / "Downloads" / "file.zip",
+    )
+
     def test_system_paths_blocked(self):
-        blocked = [
-            Path("/System/Library/something"),
-            Path("/bin/bash"),
-            Path("/sbin/fsck"),
-            Path("/usr/bin/python"),
-            Path("/usr/lib/libSystem.B.dylib"),
-            Path("/Library/Application Support/something"),
-            Path("/private/var/log/something"),
-        ]
-        for p in blocked:
+        for p in self.BLOCKED:
             self.assertTrue(
                 is_path_blocked(p),
                 f"Expected {p} to be blocked",
             )
 
     def test_safe_paths_not_blocked(self):
-        safe = [
-            HOME / "Library" / "Caches" / "com.example.app",
-            HOME / "Library" / "Logs" / "old.log",
-            HOME / "Downloads" / "file.zip",
-        ]
-        for p in safe:
+        for p in self.SAFE:
             self.assertFalse(
                 is_path_blocked(p),
                 f"Expected {p} to NOT be blocked",
@@ -54,6 +61,14 @@ class TestBlockedPaths(unittest.TestCase):
     def test_root_slash_not_in_blocked(self):
         self.assertFalse(is_path_blocked(Path("/")))
 
+    def test_prefix_itself_blocked(self):
+        self.assertTrue(is_path_blocked(Path("/System")))
+
+    def test_sibling_with_shared_prefix_not_blocked(self):
+        self.assertFalse(is_path_blocked(Path("/usr/binaries")))
+        self.assertFalse(is_path_blocked(Path("/usr/local/bin/tool")))
+        self.assertFalse(is_path_blocked(Path("/Systematic/data")))
+
 
 class TestPersonalDocPaths(unittest.TestCase):
     """Test that personal document paths are correctly identified."""
@@ -99,6 +114,13 @@ class TestSafeScan(unittest.TestCase):
             )
         )
 
+    def test_personal_root_itself_blocked(self):
+        self.assertFalse(is_path_safe_for_scan(HOME / "Documents"))
+        self.assertFalse(is_path_safe_for_scan(HOME / "Library" / "Mobile Documents"))
+
+    def test_sibling_of_personal_root_safe(self):
+        self.assertTrue(is_path_safe_for_scan(HOME / "Downloads"))
+
     def test_system_blocked_even_with_personal_flag(self):
         self.assertFalse(
             is_path_safe_for_scan(
@@ -107,6 +129,36 @@ class TestSafeScan(unittest.TestCase):
         )
 
 
+class TestStringApi(unittest.TestCase):
+    """Test that the str-taking checks agree with the Path-taking ones."""
+
+    def test_blocked_str_matches_path(self):
+        for p in BLOCKED_PATH_PREFIXES + SAFE_PATHS:
+            self.assertEqual(is_path_blocked_str(str(p / "x")), is_path_blocked(p / "x"))
+
+    def test_scan_str_matches_path(self):
+        for p in SAFE_PATHS + PERSONAL_DOC_PATHS:
+            for allow in (False, True):
+                self.assertEqual(
+                    is_path_safe_for_scan_str(str(p / "x"), allow),
+                    is_path_safe_for_scan(p / "x", allow),
+                )
+
+
+class TestProtectedDescendants(unittest.TestCase):
+    """Test detection of protected paths nested inside a scan root."""
+
+    def test_downloads_has_none(self):
+        self.assertFalse(contains_protected_paths(HOME / "Downloads"))
+
+    def test_home_contains_personal_and_blocked(self):
+        self.assertTrue(contains_protected_paths(HOME))
+        self.assertTrue(contains_protected_paths(HOME, allow_personal=True))
+
+    def test_library_contains_blocked(self):
+        self.assertTrue(contains_protected_paths(HOME / "Library", allow_personal=True))
+
+
 class TestSafeDeletion(unittest.TestCase):
     """Test the safe-for-deletion logic."""
 
@@ -126,6 +178,36 @@ class TestSafeDeletion(unittest.TestCase):
     def test_root_blocked(self):
         self.assertFalse(is_path_safe_for_deletion(Path("/")))
 
+    def test_home_via_dotdot_blocked(self):
+        self.assertFalse(is_path_safe_for_deletion(HOME / "Downloads" / ".."))
+
+
+class TestDeletionRecheck(TempDirTestCase):
+    """Test that deletion never reuses a cached scan decision."""
+
+    def setUp(self):
+        super().setUp()
+        self.safe = self.tmp / "safe"
+        self.blocked = self.tmp / "blocked"
+        self.safe.mkdir()
+        self.blocked.mkdir()
+        rules._rebuild_tables([self.blocked], [self.tmp / "Documents"])
+        self.addCleanup(
+            rules._rebuild_tables, rules.BLOCKED_PATH_PREFIXES, rules.PERSONAL_DOC_PATHS
+        )
+
+    def test_symlink_swapped_after_scan_refused(self):
+        link = self.tmp / "link"
+        os.symlink(self.safe, link)
+        self.assertTrue(is_path_safe_for_scan(link))
+
+        link.unlink()
+        os.symlink(self.blocked, link)
+
+        # The scan answer is memoized; the deletion check must not be.
+        self.assertTrue(is_path_safe_for_scan(link))
+        self.assertFalse(is_path_safe_for_deletion(link))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,129 @@
+"""
+Unit tests for scan result selection and the large-file walk.
+"""
+
+import os
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core import rules, scanner
+from core.models import ScanCategory, ScanItem, ScanResult, ScanSettings
+from core.scanner import Scanner
+from tests.support import TempDirTestCase
+
+
+def _item(name: str, size: int, category=ScanCategory.LARGE_FILE) -> ScanItem:
+    return ScanItem(Path("/data") / name, category, size, 0.0)
+
+
+class TestTopResults(unittest.TestCase):
+    """Test that the scanner keeps the largest max_results items."""
+
+    def setUp(self):
+        self.scanner = Scanner(ScanSettings(max_results=3))
+        self.part = ScanResult()
+
+    def test_keeps_largest(self):
+        for i, size in enumerate([5, 50, 1, 40, 30, 2]):
+            self.scanner._emit(self.part, _item(f"f{i}", size))
+        sizes = sorted(size for size, _, _ in self.scanner._heap)
+        self.assertEqual(sizes, [30, 40, 50])
+        self.assertEqual(self.scanner._size_floor, 30)
+
+    def test_ties_keep_first_found(self):
+        for name in ("a", "b", "c", "d"):
+            self.scanner._emit(self.part, _item(name, 10))
+        names = sorted(item.path.name for _, _, item in self.scanner._heap)
+        self.assertEqual(names, ["a", "b", "c"])
+
+    def test_rejected_item_not_queued(self):
+        for i, size in enumerate([10, 20, 30]):
+            self.scanner._emit(self.part, _item(f"f{i}", size))
+        self.assertFalse(self.scanner._emit(self.part, _item("small", 5)))
+        self.assertEqual(self.scanner.item_queue.qsize(), 3)
+
+    def test_ignore_limit_bypasses_heap(self):
+        for i in range(3):
+            self.scanner._emit(self.part, _item(f"f{i}", 100))
+        trash = _item("trash", 1, ScanCategory.TRASH)
+        self.assertTrue(self.scanner._emit(self.part, trash, ignore_limit=True))
+        self.assertEqual(self.part.items, [trash])
+        self.assertEqual(len(self.scanner._heap), 3)
+
+
+class TestLargeFileProgress(TempDirTestCase):
+    """Test that the large-file walk reports progress with no matches."""
+
+    def test_reports_directories_below_threshold(self):
+        for sub in ("a", "b"):
+            (self.tmp / sub).mkdir()
+            (self.tmp / sub / "small.txt").write_bytes(b"x")
+        reported = []
+        s = Scanner(ScanSettings())
+        s.set_progress_callback(lambda path, found: reported.append(path))
+
+        # The temp dir sits under /tmp, which the rules block.
+        with mock.patch.object(scanner, "is_path_safe_for_scan", return_value=True):
+            s._walk_for_large_files(self.tmp, 1 << 20, ScanResult())
+
+        self.assertEqual(s._heap, [])
+        self.assertTrue(reported)
+        self.assertTrue(all(os.path.isdir(p) for p in reported))
+
+
+class TestLargeFileSafety(TempDirTestCase):
+    """Test that a scan never returns protected files below a custom root."""
+
+    SIZE = (1 << 20) + 1
+
+    def setUp(self):
+        super().setUp()
+        docs = self.tmp / "Documents"
+        blocked = self.tmp / "blocked"
+        sub = self.tmp / "sub"
+        for d in (docs, blocked, sub):
+            d.mkdir()
+        for path in (self.tmp / "ok.bin", docs / "personal.bin", blocked / "blocked.bin"):
+            with open(path, "wb") as f:
+                f.truncate(self.SIZE)
+        os.symlink(docs / "personal.bin", sub / "link_personal.bin")
+        os.symlink(blocked / "blocked.bin", sub / "link_blocked.bin")
+        os.symlink(docs, sub / "link_docs")
+        os.symlink(blocked, sub / "link_blocked")
+
+        # Point the rules at the temp tree. This also lifts the real /tmp
+        # block, which would otherwise reject the whole root.
+        rules._rebuild_tables([blocked], [docs])
+        self.addCleanup(
+            rules._rebuild_tables, rules.BLOCKED_PATH_PREFIXES, rules.PERSONAL_DOC_PATHS
+        )
+        self.patch(scanner, "HOME", self.tmp)
+
+    def _scan(self, allow_personal: bool):
+        settings = ScanSettings(
+            size_threshold_mb=1,
+            allow_personal_docs=allow_personal,
+            follow_symlinks=True,
+            scan_caches=False,
+            scan_downloads=False,
+            scan_logs=False,
+            scan_trash=False,
+            custom_scan_folders=[self.tmp],
+        )
+        result = Scanner(settings).scan()
+        self.assertEqual(result.errors, [])
+        return {item.path.relative_to(self.tmp).as_posix() for item in result.items}
+
+    def test_personal_and_blocked_excluded(self):
+        self.assertEqual(self._scan(allow_personal=False), {"ok.bin"})
+
+    def test_blocked_excluded_with_personal_allowed(self):
+        self.assertEqual(
+            self._scan(allow_personal=True),
+            {"ok.bin", "Documents/personal.bin", "sub/link_personal.bin"},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Unit tests for filesystem utilities.
+"""
+
+import csv
+import os
+import unittest
+from pathlib import Path
+
+from core.models import ScanCategory, ScanItem
+from core.utils import (
+    export_to_csv,
+    format_size,
+    get_directory_size,
+    get_entry_size,
+    iter_tree,
+)
+from tests.support import TempDirTestCase
+
+
+class TestFormatSize(unittest.TestCase):
+    """Test human-readable size formatting at unit boundaries."""
+
+    def test_unit_boundaries(self):
+        cases = {
+            0: "0.0 B",
+            1023: "1023.0 B",
+            1024: "1.0 KB",
+            1024 ** 2 - 1: "1024.0 KB",
+            5 * 1024 ** 3: "5.0 GB",
+            1024 ** 5: "1.0 PB",
+            1024 ** 6: "1024.0 PB",
+        }
+        for size, expected in cases.items():
+            self.assertEqual(format_size(size), expected)
+
+    def test_negative_is_zero(self):
+        self.assertEqual(format_size(-5), "0 B")
+
+    def test_item_size_human(self):
+        item = ScanItem(Path("/x"), ScanCategory.CACHE, 3 * 1024 ** 2, 0.0)
+        self.assertEqual(item.size_human, "3.0 MB")
+
+
+class TestIterTree(TempDirTestCase):
+    """Test the os.scandir-based directory walker."""
+
+    def setUp(self):
+        super().setUp()
+        self.root = self.tmp
+        (self.root / "a.bin").write_bytes(b"x" * 10)
+        (self.root / "sub").mkdir()
+        (self.root / "sub" / "b.bin").write_bytes(b"x" * 20)
+        (self.root / "sub" / "deeper").mkdir()
+        (self.root / "sub" / "deeper" / "c.bin").write_bytes(b"x" * 30)
+
+    def test_yields_all_entries(self):
+        names = {entry.name for entry, _ in iter_tree(self.root)}
+        self.assertEqual(names, {"a.bin", "sub", "b.bin", "deeper", "c.bin"})
+
+    def test_stat_matches_entry(self):
+        for entry, st in iter_tree(self.root):
+            if entry.is_file():
+                self.assertEqual(st.st_size, os.path.getsize(entry.path))
+
+    def test_does_not_descend_symlinked_dirs(self):
+        os.symlink(self.root / "sub", self.root / "link")
+        paths = [entry.path for entry, _ in iter_tree(self.root)]
+        self.assertIn(str(self.root / "link"), paths)
+        self.assertFalse(any(p.startswith(str(self.root / "link") + os.sep) for p in paths))
+
+    def test_missing_root_yields_nothing(self):
+        self.assertEqual(list(iter_tree(self.root / "missing")), [])
+
+
+class TestDirectorySize(TempDirTestCase):
+    """Test recursive directory sizing."""
+
+    def setUp(self):
+        super().setUp()
+        self.root = self.tmp
+        (self.root / "a.bin").write_bytes(b"x" * 100)
+        (self.root / "sub").mkdir()
+        (self.root / "sub" / "b.bin").write_bytes(b"x" * 50)
+
+    def test_sums_nested_files(self):
+        self.assertEqual(get_directory_size(self.root), 150)
+
+    def test_skips_symlinks_by_default(self):
+        os.symlink(self.root / "a.bin", self.root / "alias.bin")
+        self.assertEqual(get_directory_size(self.root), 150)
+
+    def test_follows_file_symlinks_when_enabled(self):
+        os.symlink(self.root / "a.bin", self.root / "alias.bin")
+        self.assertEqual(get_directory_size(self.root, follow_symlinks=True), 250)
+
+    def test_entry_size(self):
+        os.symlink(self.root / "a.bin", self.root / "alias.bin")
+        with os.scandir(self.root) as it:
+            sizes = {entry.name: get_entry_size(entry) for entry in it}
+        self.assertEqual(sizes, {"a.bin": 100, "sub": 50, "alias.bin": 0})
+
+
+class TestExportCsv(TempDirTestCase):
+    """Test CSV export of scan items."""
+
+    def setUp(self):
+        super().setUp()
+        self.out = self.tmp / "out.csv"
+
+    def test_header_and_rows(self):
+        items = [
+            ScanItem(Path(f"/data/file{i}.bin"), ScanCategory.LARGE_FILE, 2048 * i, 0.0)
+            for i in range(3)
+        ]
+        export_to_csv(items, self.out)
+
+        with open(self.out, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        self.assertEqual(rows[0][:4], ["timestamp", "category", "size_bytes", "size_human"])
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[2][1:4], ["Large File", "2048", "2.0 KB"])
+        self.assertEqual(rows[3][5], "/data/file2.bin")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,35 +7,107 @@ Grid-based responsive layout with card components.
 
 import logging
 import os
+import queue
 import subprocess
 import sys
 import threading
 import tkinter as tk
+from concurrent.futures import Future
+from concurrent.futures import wait as futures_wait
+from functools import lru_cache, partial
 from tkinter import ttk, filedialog, messagebox
+from tkinter import font as tkfont
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 import customtkinter as ctk
 
-from core.delete import delete_items, empty_trash
 from core.models import ScanCategory, ScanResult, ScanSettings
-from core.scanner import Scanner
-from core.utils import export_to_csv, format_size
-from ui.confirm_dialog import ConfirmDeleteDialog, ConfirmTrashDialog
+from core.rules import TRASH_PATH, clear_rule_caches, is_path_blocked
+from core.utils import export_to_csv, format_size, get_directory_size
 from ui.results_table import ResultsTable
-from ui.settings_dialog import SettingsDialog
+
+# The scanner, deletion code and dialogs are imported where they are first
+# used, so the window can be shown before they are loaded.
+if TYPE_CHECKING:
+    from core.scanner import Scanner
+    from ui.confirm_dialog import ConfirmDeleteDialog, ConfirmTrashDialog
 
 logger = logging.getLogger("mac_cleanup")
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+SCAN_DRAIN_INTERVAL_MS = 200
+PROGRESS_POLL_INTERVAL_MS = 50
+STATS_DEBOUNCE_MS = 100
+# Longest the close handler waits for a cancelled scan to unwind.
+SCAN_SHUTDOWN_TIMEOUT_S = 1.0
+# Indeterminate bar advance per scan progress report (a full sweep is 80).
+SCAN_PROGRESS_STEP = 4
+# How often the Tk thread checks whether background work has finished.
+# Worker threads never call into Tk themselves.
+BACKGROUND_POLL_INTERVAL_MS = 50
+
+HELP_TEXT = (
+    "Mac Cleanup Tool\n"
+    "=================\n\n"
+    "Safely find and reclaim disk space on your Mac.\n\n"
+    "SAFETY:\n"
+    "  - System files are NEVER touched\n"
+    "  - Personal folders excluded by default\n"
+    "  - Dry Run mode ON by default\n"
+    "  - All deletions go to Trash\n"
+    "  - Type 'DELETE' to confirm\n\n"
+    "HOW TO USE:\n"
+    "  1. Select scan types in sidebar\n"
+    "  2. Click Scan\n"
+    "  3. Review results\n"
+    "  4. Select items to remove\n"
+    "  5. Click Delete Selected\n\n"
+    "SCAN TYPES:\n"
+    "  - Large Files (default >1 GB)\n"
+    "  - Caches (>30 days old)\n"
+    "  - Old Downloads (>90 days)\n"
+    "  - Log Files\n"
+    "  - Trash Report\n\n"
+    "SETTINGS:\n"
+    "  Adjust thresholds, Dry Run, and\n"
+    "  personal folder access."
+)
+
+TRASH_ITEMS_MESSAGE = "Trash items cannot be deleted here.\nUse 'Empty Trash' instead."
+
+# Command used to reveal a folder in the platform file manager; None means
+# fall back to os.startfile (Windows).
+OPEN_FOLDER_ARGV = {"darwin": ["open"], "linux": ["xdg-open"]}.get(sys.platform)
+OPENER_POLL_INTERVAL_MS = 250
+
+
+@lru_cache(maxsize=None)
+def _appkit_opener() -> Optional[Tuple[object, object]]:
+    """
+    Return PyObjC's (NSWorkspace, NSURL), or None without PyObjC.
+    PyObjC is optional: with it, Open Folder asks NSWorkspace directly
+    instead of spawning /usr/bin/open. Imported on first use; the result,
+    including a failed import, is cached.
+    """
+    try:
+        from AppKit import NSWorkspace
+        from Foundation import NSURL
+    except ImportError:
+        return None
+    return NSWorkspace, NSURL
+
 
 class AppWindow(ctk.CTk):
     """Main application window with modern dashboard layout."""
 
     def __init__(self):
         super().__init__()
+        # Stay unmapped while the widgets are built so the first paint
+        # happens once, with geometry already settled.
+        self.withdraw()
 
         self.title("Mac Cleanup Tool")
         self.geometry("1250x780")
@@ -43,8 +115,37 @@ class AppWindow(ctk.CTk):
 
         self.settings = ScanSettings()
         self.scan_result: Optional[ScanResult] = None
-        self._scanner: Optional[Scanner] = None
-        self._scan_thread: Optional[threading.Thread] = None
+        self._scanner: Optional["Scanner"] = None
+        # One daemon worker, reused for every scan; the scanner runs its own
+        # pool. Being a daemon, it never holds up interpreter exit.
+        self._scan_requests: "queue.SimpleQueue[Tuple[Scanner, Future]]" = queue.SimpleQueue()
+        self._scan_worker = threading.Thread(
+            target=self._scan_worker_loop, name="scan-worker", daemon=True
+        )
+        self._scan_worker.start()
+        self._scan_future: Optional[Future] = None
+        # Reused file dialogs; each also remembers the last directory chosen.
+        self._folder_dialog = filedialog.Directory(self, title="Select folder to scan")
+        self._export_dialog = filedialog.SaveAs(
+            self,
+            title="Export CSV",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            initialfile="mac_cleanup_report.csv",
+        )
+        self._drain_after_id: Optional[str] = None
+        self._progress_after_id: Optional[str] = None
+        self._stats_after_id: Optional[str] = None
+        self._latest_progress: Optional[Tuple[str, int]] = None
+        self._fonts: Dict[Tuple[int, str], ctk.CTkFont] = {}
+        self._trash_owns_progress = False
+        self._last_dry_run_state: Optional[bool] = None
+        self._last_summary: Optional[Tuple[str, str]] = None
+        self._category_buttons: Dict[ScanCategory, ctk.CTkButton] = {}
+        self._shown_categories: Tuple[ScanCategory, ...] = ()
+        # Confirmation dialogs are built on first use and then reused.
+        self._confirm_delete_dialog: Optional["ConfirmDeleteDialog"] = None
+        self._confirm_trash_dialog: Optional["ConfirmTrashDialog"] = None
 
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -55,8 +156,27 @@ class AppWindow(ctk.CTk):
         self._build_main_content()
         self._build_footer()
         self._update_dry_run_indicator()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self.update_idletasks()
+        self.deiconify()
+
+    def _font(self, size: int, weight: str = "normal") -> ctk.CTkFont:
+        """Return a shared CTkFont for (size, weight), creating it on first use."""
+        key = (size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(size=size, weight=weight)
+        return font
 
     def _style_treeview(self):
+        # Named Font objects are resolved by Tk once; passing tuples makes it
+        # look the family up again wherever the style is applied. Keep them
+        # on self, as Tk deletes a named font when its Python object dies.
+        self._tree_fonts = {
+            "body": tkfont.Font(self, family="Helvetica", size=12),
+            "heading": tkfont.Font(self, family="Helvetica", size=11, weight="bold"),
+        }
         style = ttk.Style(self)
         style.theme_use("clam")
         style.configure(
@@ -65,7 +185,7 @@ class AppWindow(ctk.CTk):
             foreground="#dce4ee",
             fieldbackground="#1d1e1e",
             borderwidth=0,
-            font=("Helvetica", 12),
+            font=self._tree_fonts["body"],
             rowheight=32,
         )
         style.configure(
@@ -73,7 +193,7 @@ class AppWindow(ctk.CTk):
             background="#2a2d2e",
             foreground="#8b949e",
             borderwidth=0,
-            font=("Helvetica", 11, "bold"),
+            font=self._tree_fonts["heading"],
             relief="flat",
             padding=(8, 6),
         )
@@ -87,6 +207,7 @@ class AppWindow(ctk.CTk):
             background=[("active", "#343a40")],
         )
         style.configure("TScrollbar", background="#2a2d2e", troughcolor="#1d1e1e", borderwidth=0)
+        style.configure("Results.TFrame", background="#1d1e1e")
 
     def _build_sidebar(self):
         sidebar = ctk.CTkFrame(self, width=220, corner_radius=0, fg_color="#1a1b1e")
@@ -99,20 +220,20 @@ class AppWindow(ctk.CTk):
         ctk.CTkLabel(
             logo_frame,
             text="\U0001f9f9",
-            font=ctk.CTkFont(size=28),
+            font=self._font(28),
         ).pack(anchor="w")
 
         ctk.CTkLabel(
             logo_frame,
             text="Mac Cleanup",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=self._font(18, "bold"),
             text_color="#ffffff",
         ).pack(anchor="w", pady=(4, 0))
 
         ctk.CTkLabel(
             logo_frame,
             text="Disk Space Manager",
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             text_color="#6b7280",
         ).pack(anchor="w")
 
@@ -125,31 +246,34 @@ class AppWindow(ctk.CTk):
         ctk.CTkLabel(
             scan_section,
             text="SCAN TARGETS",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=self._font(10, "bold"),
             text_color="#6b7280",
         ).pack(anchor="w", pady=(0, 10))
 
-        self.scan_large_var = ctk.BooleanVar(value=True)
-        self.scan_cache_var = ctk.BooleanVar(value=True)
-        self.scan_downloads_var = ctk.BooleanVar(value=True)
-        self.scan_logs_var = ctk.BooleanVar(value=True)
-        self.scan_trash_var = ctk.BooleanVar(value=True)
+        settings = self.settings
+        self.scan_large_var = ctk.BooleanVar(value=settings.scan_large_files)
+        self.scan_cache_var = ctk.BooleanVar(value=settings.scan_caches)
+        self.scan_downloads_var = ctk.BooleanVar(value=settings.scan_downloads)
+        self.scan_logs_var = ctk.BooleanVar(value=settings.scan_logs)
+        self.scan_trash_var = ctk.BooleanVar(value=settings.scan_trash)
 
         checks = [
-            ("\U0001f4c1  Large Files", self.scan_large_var),
-            ("\U0001f5c4\ufe0f  Caches", self.scan_cache_var),
-            ("\u2b07\ufe0f  Old Downloads", self.scan_downloads_var),
-            ("\U0001f4c4  Log Files", self.scan_logs_var),
-            ("\U0001f5d1\ufe0f  Trash", self.scan_trash_var),
+            ("\U0001f4c1  Large Files", self.scan_large_var, "scan_large_files"),
+            ("\U0001f5c4\ufe0f  Caches", self.scan_cache_var, "scan_caches"),
+            ("\u2b07\ufe0f  Old Downloads", self.scan_downloads_var, "scan_downloads"),
+            ("\U0001f4c4  Log Files", self.scan_logs_var, "scan_logs"),
+            ("\U0001f5d1\ufe0f  Trash", self.scan_trash_var, "scan_trash"),
         ]
-        for text, var in checks:
-            ctk.CTkCheckBox(
-                scan_section, text=text, variable=var,
-                font=ctk.CTkFont(size=13),
-                corner_radius=6, border_width=2,
-                checkbox_width=22, checkbox_height=22,
-                fg_color="#3b82f6", hover_color="#2563eb",
-            ).pack(anchor="w", pady=4)
+        checkbox_kw = dict(
+            font=self._font(13),
+            corner_radius=6, border_width=2,
+            checkbox_width=22, checkbox_height=22,
+            fg_color="#3b82f6", hover_color="#2563eb",
+        )
+        for text, var, attr in checks:
+            # Write through to settings, so _start_scan has nothing to sync.
+            var.trace_add("write", partial(self._on_scan_target_toggled, attr, var))
+            ctk.CTkCheckBox(scan_section, text=text, variable=var, **checkbox_kw).pack(anchor="w", pady=4)
 
         sep2 = ctk.CTkFrame(sidebar, height=1, fg_color="#2d2f33")
         sep2.pack(fill="x", padx=16, pady=(16, 16))
@@ -160,42 +284,46 @@ class AppWindow(ctk.CTk):
         ctk.CTkLabel(
             sel_section,
             text="QUICK SELECT",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=self._font(10, "bold"),
             text_color="#6b7280",
         ).pack(anchor="w", pady=(0, 8))
 
         btn_grid = ctk.CTkFrame(sel_section, fg_color="transparent")
         btn_grid.pack(fill="x")
 
-        ctk.CTkButton(
-            btn_grid, text="Select All",
-            command=lambda: self.results_table.select_all(True),
-            height=30, corner_radius=6,
-            font=ctk.CTkFont(size=12),
-            fg_color="#2d2f33", hover_color="#3d3f43",
-            text_color="#c9d1d9",
-        ).pack(fill="x", pady=2)
-
-        ctk.CTkButton(
-            btn_grid, text="Deselect All",
-            command=lambda: self.results_table.select_all(False),
+        # Shared styles for the sidebar's button families.
+        filled_kw = dict(
             height=30, corner_radius=6,
-            font=ctk.CTkFont(size=12),
+            font=self._font(12),
             fg_color="#2d2f33", hover_color="#3d3f43",
             text_color="#c9d1d9",
-        ).pack(fill="x", pady=2)
+        )
+        category_kw = dict(
+            height=28, corner_radius=6,
+            font=self._font(11),
+            fg_color="transparent", hover_color="#2d2f33",
+            text_color="#8b949e",
+            anchor="w",
+        )
+        nav_kw = dict(
+            height=36, corner_radius=8,
+            font=self._font(13),
+            fg_color="transparent", hover_color="#2d2f33",
+            text_color="#8b949e",
+            anchor="w",
+        )
 
-        for cat in ScanCategory:
+        for text, select in (("Select All", True), ("Deselect All", False)):
             ctk.CTkButton(
-                btn_grid,
-                text=f"All {cat.value}",
-                command=lambda c=cat: self.results_table.select_all_category(c, True),
-                height=28, corner_radius=6,
-                font=ctk.CTkFont(size=11),
-                fg_color="transparent", hover_color="#2d2f33",
-                text_color="#8b949e",
-                anchor="w",
-            ).pack(fill="x", pady=1)
+                btn_grid, text=text,
+                command=lambda s=select: self.results_table.select_all(s),
+                **filled_kw,
+            ).pack(fill="x", pady=2)
+
+        # Per-category buttons are created after a scan, and only for the
+        # categories it found; see _show_category_buttons.
+        self._category_btn_parent = btn_grid
+        self._category_kw = category_kw
 
         sep3 = ctk.CTkFrame(sidebar, height=1, fg_color="#2d2f33")
         sep3.pack(fill="x", padx=16, pady=(16, 16))
@@ -203,16 +331,13 @@ class AppWindow(ctk.CTk):
         ctk.CTkButton(
             sidebar, text="\U0001f4c2  Add Folder...",
             command=self._add_custom_folder,
-            height=32, corner_radius=6,
-            font=ctk.CTkFont(size=12),
-            fg_color="#2d2f33", hover_color="#3d3f43",
-            text_color="#c9d1d9",
+            **dict(filled_kw, height=32),
         ).pack(fill="x", padx=16, pady=(0, 4))
 
         self.custom_folders_label = ctk.CTkLabel(
             sidebar,
             text="0 custom folders",
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             text_color="#6b7280",
         )
         self.custom_folders_label.pack(anchor="w", padx=20)
@@ -220,25 +345,11 @@ class AppWindow(ctk.CTk):
         bottom_frame = ctk.CTkFrame(sidebar, fg_color="transparent")
         bottom_frame.pack(side="bottom", fill="x", padx=16, pady=16)
 
-        ctk.CTkButton(
-            bottom_frame, text="\u2699\ufe0f  Settings",
-            command=self._open_settings,
-            height=36, corner_radius=8,
-            font=ctk.CTkFont(size=13),
-            fg_color="transparent", hover_color="#2d2f33",
-            text_color="#8b949e",
-            anchor="w",
-        ).pack(fill="x", pady=2)
-
-        ctk.CTkButton(
-            bottom_frame, text="\u2753  Help",
-            command=self._show_help,
-            height=36, corner_radius=8,
-            font=ctk.CTkFont(size=13),
-            fg_color="transparent", hover_color="#2d2f33",
-            text_color="#8b949e",
-            anchor="w",
-        ).pack(fill="x", pady=2)
+        for text, command in (
+            ("\u2699\ufe0f  Settings", self._open_settings),
+            ("\u2753  Help", self._show_help),
+        ):
+            ctk.CTkButton(bottom_frame, text=text, command=command, **nav_kw).pack(fill="x", pady=2)
 
     def _build_header(self):
         header = ctk.CTkFrame(self, height=70, corner_radius=0, fg_color="transparent")
@@ -250,14 +361,14 @@ class AppWindow(ctk.CTk):
         ctk.CTkLabel(
             left,
             text="Dashboard",
-            font=ctk.CTkFont(size=26, weight="bold"),
+            font=self._font(26, "bold"),
             text_color="#ffffff",
         ).pack(anchor="w")
 
         self.summary_label = ctk.CTkLabel(
             left,
             text="Ready to scan. Select targets and click Scan.",
-            font=ctk.CTkFont(size=13),
+            font=self._font(13),
             text_color="#6b7280",
         )
         self.summary_label.pack(anchor="w", pady=(2, 0))
@@ -268,7 +379,7 @@ class AppWindow(ctk.CTk):
         self.dry_run_badge = ctk.CTkLabel(
             right,
             text="",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._font(12, "bold"),
             corner_radius=6,
             width=120, height=28,
         )
@@ -298,32 +409,34 @@ class AppWindow(ctk.CTk):
         ctk.CTkLabel(
             table_header,
             text="Scan Results",
-            font=ctk.CTkFont(size=15, weight="bold"),
+            font=self._font(15, "bold"),
             text_color="#e5e7eb",
         ).pack(side="left")
 
         table_actions = ctk.CTkFrame(table_header, fg_color="transparent")
         table_actions.pack(side="right")
 
-        ctk.CTkButton(
+        self.export_btn = ctk.CTkButton(
             table_actions, text="Export CSV",
             command=self._export_csv,
             width=90, height=30, corner_radius=6,
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             fg_color="#2d2f33", hover_color="#3d3f43",
             text_color="#c9d1d9",
-        ).pack(side="left", padx=4)
+        )
+        self.export_btn.pack(side="left", padx=4)
 
         ctk.CTkButton(
             table_actions, text="Open Folder",
             command=self._open_folder,
             width=95, height=30, corner_radius=6,
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             fg_color="#2d2f33", hover_color="#3d3f43",
             text_color="#c9d1d9",
         ).pack(side="left", padx=4)
 
         self.results_table = ResultsTable(table_card)
+        self.results_table.set_selection_callback(self._update_stats)
         self.results_table.pack(fill="both", expand=True, padx=8, pady=(8, 8))
 
     def _make_stat_card(self, parent, col, title, value, color):
@@ -337,14 +450,14 @@ class AppWindow(ctk.CTk):
         ctk.CTkLabel(
             inner,
             text=title.upper(),
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=self._font(10, "bold"),
             text_color="#6b7280",
         ).pack(anchor="w")
 
         val_label = ctk.CTkLabel(
             inner,
             text=value,
-            font=ctk.CTkFont(size=24, weight="bold"),
+            font=self._font(24, "bold"),
             text_color=color,
         )
         val_label.pack(anchor="w", pady=(2, 0))
@@ -366,7 +479,7 @@ class AppWindow(ctk.CTk):
             left_btns, text="\u25b6  Scan",
             command=self._start_scan,
             width=120, height=40, corner_radius=10,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=self._font(14, "bold"),
             fg_color="#3b82f6", hover_color="#2563eb",
         )
         self.scan_btn.pack(side="left", padx=(0, 8))
@@ -375,7 +488,7 @@ class AppWindow(ctk.CTk):
             left_btns, text="Cancel",
             command=self._cancel_scan,
             width=80, height=40, corner_radius=10,
-            font=ctk.CTkFont(size=13),
+            font=self._font(13),
             fg_color="#2d2f33", hover_color="#3d3f43",
             text_color="#8b949e",
             state="disabled",
@@ -386,7 +499,7 @@ class AppWindow(ctk.CTk):
             left_btns, text="\U0001f5d1  Delete Selected",
             command=self._delete_selected,
             width=150, height=40, corner_radius=10,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(13, "bold"),
             fg_color="#dc2626", hover_color="#b91c1c",
         )
         self.delete_btn.pack(side="left", padx=(0, 8))
@@ -395,7 +508,7 @@ class AppWindow(ctk.CTk):
             left_btns, text="Empty Trash",
             command=self._empty_trash,
             width=110, height=40, corner_radius=10,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=self._font(13, "bold"),
             fg_color="#dc2626", hover_color="#b91c1c",
         )
         self.trash_btn.pack(side="left")
@@ -405,7 +518,7 @@ class AppWindow(ctk.CTk):
 
         self.progress_label = ctk.CTkLabel(
             right_progress, text="",
-            font=ctk.CTkFont(size=11),
+            font=self._font(11),
             text_color="#6b7280",
         )
         self.progress_label.pack(side="right")
@@ -419,6 +532,9 @@ class AppWindow(ctk.CTk):
         self.progress_bar.set(0)
 
     def _update_dry_run_indicator(self):
+        if self.settings.dry_run == self._last_dry_run_state:
+            return
+        self._last_dry_run_state = self.settings.dry_run
         if self.settings.dry_run:
             self.dry_run_badge.configure(
                 text=" DRY RUN ",
@@ -432,19 +548,64 @@ class AppWindow(ctk.CTk):
                 fg_color="#450a0a",
             )
 
+    @staticmethod
+    def _set_text(widget: ctk.CTkBaseClass, text: str):
+        """Configure a widget's text only if it differs, sparing a CTk redraw."""
+        if widget.cget("text") != text:
+            widget.configure(text=text)
+
+    def _set_summary(self, text: str, color: str):
+        """Update the summary label, skipping the Tk call if nothing changed."""
+        if (text, color) == self._last_summary:
+            return
+        self._last_summary = (text, color)
+        self.summary_label.configure(text=text, text_color=color)
+
+    def _show_category_buttons(self, items):
+        """Show an "All <category>" button for each category present in items."""
+        present = {item.category for item in items}
+        shown = tuple(cat for cat in ScanCategory if cat in present)
+        if shown == self._shown_categories:
+            return
+        for btn in self._category_buttons.values():
+            btn.pack_forget()
+        for cat in shown:
+            btn = self._category_buttons.get(cat)
+            if btn is None:
+                btn = ctk.CTkButton(
+                    self._category_btn_parent,
+                    text=f"All {cat.value}",
+                    command=partial(self._select_category, cat),
+                    **self._category_kw,
+                )
+                self._category_buttons[cat] = btn
+            btn.pack(fill="x", pady=1)
+        self._shown_categories = shown
+
+    def _on_scan_target_toggled(self, attr: str, var: ctk.BooleanVar, *_):
+        setattr(self.settings, attr, var.get())
+
+    def _select_category(self, category: ScanCategory):
+        self.results_table.select_all_category(category, True)
+
     def _update_stats(self):
+        """Refresh the stat cards once calls stop arriving for STATS_DEBOUNCE_MS."""
+        if self._stats_after_id is not None:
+            self.after_cancel(self._stats_after_id)
+        self._stats_after_id = self.after(STATS_DEBOUNCE_MS, self._update_stats_now)
+
+    def _update_stats_now(self):
+        self._stats_after_id = None
         if self.scan_result:
-            self.stat_items.configure(text=str(self.scan_result.item_count))
-            self.stat_size.configure(text=self.scan_result.total_size_human)
-            self.stat_duration.configure(text=f"{self.scan_result.scan_duration_seconds:.1f}s")
-        selected = self.results_table.get_selected_items()
-        self.stat_selected.configure(text=str(len(selected)))
+            self._set_text(self.stat_items, str(self.scan_result.item_count))
+            self._set_text(self.stat_size, self.scan_result.total_size_human)
+            self._set_text(self.stat_duration, f"{self.scan_result.scan_duration_seconds:.1f}s")
+        self._set_text(self.stat_selected, str(self.results_table.selected_count()))
 
     def _add_custom_folder(self):
-        folder = filedialog.askdirectory(title="Select folder to scan")
+        folder = self._folder_dialog.show()
         if folder:
             path = Path(folder)
-            from core.rules import is_path_blocked
             if is_path_blocked(path):
                 messagebox.showwarning(
                     "Blocked Path",
@@ -452,64 +613,133 @@ class AppWindow(ctk.CTk):
                     "System directories cannot be scanned.",
                 )
                 return
-            if path not in self.settings.custom_scan_folders:
-                self.settings.custom_scan_folders.append(path)
+            if self.settings.add_custom_folder(path):
+                clear_rule_caches()
                 self.custom_folders_label.configure(
                     text=f"{len(self.settings.custom_scan_folders)} custom folder(s)"
                 )
 
     def _start_scan(self):
-        self.settings.scan_large_files = self.scan_large_var.get()
-        self.settings.scan_caches = self.scan_cache_var.get()
-        self.settings.scan_downloads = self.scan_downloads_var.get()
-        self.settings.scan_logs = self.scan_logs_var.get()
-        self.settings.scan_trash = self.scan_trash_var.get()
-
-        self.scan_btn.configure(state="disabled")
-        self.cancel_btn.configure(state="normal")
-        self.delete_btn.configure(state="disabled")
-        self.progress_bar.start()
-        self.summary_label.configure(text="Scanning your system...", text_color="#3b82f6")
+        from core.scanner import Scanner
+
+        if self._scan_future is not None and not self._scan_future.done():
+            return
+
+        self._set_scanning_state(True)
+        self._set_summary("Scanning your system...", "#3b82f6")
 
         self._scanner = Scanner(self.settings)
         self._scanner.set_progress_callback(self._on_scan_progress)
+        self.results_table.clear()
+
+        self._latest_progress = None
+        self._scan_future = Future()
+        self._scan_requests.put((self._scanner, self._scan_future))
+        self._when_done(self._scan_future, self._on_scan_complete)
+        self._drain_after_id = self.after(SCAN_DRAIN_INTERVAL_MS, self._drain_scan_items)
+        self._progress_after_id = self.after(PROGRESS_POLL_INTERVAL_MS, self._drain_progress)
+
+    def _set_scanning_state(self, scanning: bool):
+        """Flip the scan controls and progress bar between idle and scanning."""
+        idle_state, busy_state = ("disabled", "normal") if scanning else ("normal", "disabled")
+        self.scan_btn.configure(state=idle_state)
+        self.delete_btn.configure(state=idle_state)
+        self.cancel_btn.configure(state=busy_state)
+        # While scanning, the bar is not animated on a timer; _drain_progress
+        # steps it whenever the scanner has reported something new.
+        if scanning:
+            self.progress_bar.configure(indeterminate_speed=SCAN_PROGRESS_STEP)
+        else:
+            self.progress_bar.configure(indeterminate_speed=1)
+            self.progress_bar.set(0)
+
+    def _scan_worker_loop(self):
+        """Run queued scans one at a time on a single long-lived thread."""
+        while True:
+            scanner, future = self._scan_requests.get()
+            if future.set_running_or_notify_cancel():
+                future.set_result(self._run_scan(scanner))
+
+    def _run_scan(self, scanner: "Scanner") -> ScanResult:
+        """Run one scan on the scan worker; failures become an errors-only result."""
+        try:
+            return scanner.scan()
+        except Exception as e:
+            logger.error(f"Scan failed: {e}", exc_info=True)
+            return ScanResult(errors=[str(e)])
 
-        self._scan_thread = threading.Thread(target=self._run_scan, daemon=True)
-        self._scan_thread.start()
+    @staticmethod
+    def _run_in_thread(func, *args) -> Future:
+        """Run func(*args) on a daemon thread and return a Future for its result."""
+        future: Future = Future()
 
-    def _run_scan(self):
-        result = self._scanner.scan()
-        self.after(0, self._on_scan_complete, result)
+        def worker():
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=worker, daemon=True).start()
+        return future
+
+    def _when_done(self, future: Future, callback, *args):
+        """Call callback(*args, future.result()) on the Tk thread once future finishes."""
+        if future.done():
+            callback(*args, future.result())
+        else:
+            self.after(BACKGROUND_POLL_INTERVAL_MS, self._when_done, future, callback, *args)
+
+    def _drain_scan_items(self):
+        """Show items streamed by the scanner so far, then reschedule."""
+        batch = []
+        item_queue = self._scanner.item_queue
+        while True:
+            try:
+                batch.append(item_queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self.results_table.append_items(batch)
+        self._drain_after_id = self.after(SCAN_DRAIN_INTERVAL_MS, self._drain_scan_items)
 
     def _on_scan_progress(self, current_path: str, items_found: int):
-        short_path = current_path
-        if len(short_path) > 40:
-            short_path = "..." + short_path[-37:]
-        self.after(
-            0,
-            lambda: self.progress_label.configure(
-                text=f"{items_found} items  \u2022  {short_path}"
-            ),
-        )
+        # Called from scan threads: shorten the path here and only stamp the
+        # latest state. The Tk thread picks it up in _drain_progress.
+        if len(current_path) > 40:
+            current_path = "..." + current_path[-37:]
+        self._latest_progress = (current_path, items_found)
+
+    def _drain_progress(self):
+        """Show the most recent scan progress, then reschedule."""
+        progress = self._latest_progress
+        if progress is not None:
+            self._latest_progress = None
+            short_path, items_found = progress
+            self.progress_bar.step()
+            self._set_text(self.progress_label, f"{items_found} items  \u2022  {short_path}")
+        self._progress_after_id = self.after(PROGRESS_POLL_INTERVAL_MS, self._drain_progress)
 
     def _on_scan_complete(self, result: ScanResult):
+        if self._drain_after_id is not None:
+            self.after_cancel(self._drain_after_id)
+            self._drain_after_id = None
+        if self._progress_after_id is not None:
+            self.after_cancel(self._progress_after_id)
+            self._progress_after_id = None
         self.scan_result = result
-        self.progress_bar.stop()
-        self.progress_bar.set(0)
-        self.scan_btn.configure(state="normal")
-        self.cancel_btn.configure(state="disabled")
-        self.delete_btn.configure(state="normal")
-        self.progress_label.configure(text="")
+        self._set_scanning_state(False)
+        self._set_text(self.progress_label, "")
 
-        self.results_table.populate(result.items)
+        self.results_table.populate_incremental(result.items)
+        self._show_category_buttons(result.items)
         self._update_stats()
 
         status = "Cancelled" if result.was_cancelled else "Complete"
         color = "#10b981" if not result.was_cancelled else "#f59e0b"
-        self.summary_label.configure(
-            text=f"Scan {status} \u2014 {result.item_count} items found, "
+        self._set_summary(
+            f"Scan {status} \u2014 {result.item_count} items found, "
             f"{result.total_size_human} reclaimable",
-            text_color=color,
+            color,
         )
 
         if result.errors:
@@ -519,45 +749,59 @@ class AppWindow(ctk.CTk):
         if self._scanner:
             self._scanner.cancel()
             self.cancel_btn.configure(state="disabled")
-            self.summary_label.configure(text="Cancelling scan...", text_color="#f59e0b")
+            self._set_summary("Cancelling scan...", "#f59e0b")
 
     def _delete_selected(self):
+        from core.delete import delete_items
+        from ui.confirm_dialog import ConfirmDeleteDialog
+
         selected = self.results_table.get_selected_items()
         if not selected:
             messagebox.showinfo("No Selection", "No items selected for deletion.")
             return
 
-        selected = [item for item in selected if item.category != ScanCategory.TRASH]
-        if not selected:
-            messagebox.showinfo(
-                "Trash Items",
-                "Trash items cannot be deleted here.\nUse 'Empty Trash' instead.",
-            )
+        # One pass: split off Trash rows and take their size out of the
+        # table's running selection total.
+        deletable = []
+        trash_size = 0
+        trash_category = ScanCategory.TRASH
+        for item in selected:
+            if item.category == trash_category:
+                trash_size += item.size_bytes
+            else:
+                deletable.append(item)
+        if not deletable:
+            messagebox.showinfo("Trash Items", TRASH_ITEMS_MESSAGE)
             return
 
-        total_size = sum(item.size_bytes for item in selected)
+        total_size = self.results_table.get_selected_size() - trash_size
+        selected = deletable
 
-        dialog = ConfirmDeleteDialog(
-            self,
+        if self._confirm_delete_dialog is None:
+            self._confirm_delete_dialog = ConfirmDeleteDialog(self)
+        confirmed = self._confirm_delete_dialog.ask(
             file_count=len(selected),
             total_size=format_size(total_size),
             dry_run=self.settings.dry_run,
         )
 
-        if not dialog.result:
+        if not confirmed:
             return
 
+        statuses_before = [item.status for item in selected]
         results = delete_items(
             selected,
             allow_personal=self.settings.allow_personal_docs,
             dry_run=self.settings.dry_run,
         )
 
-        success_count = sum(1 for _, ok, _ in results if ok)
-        fail_count = sum(1 for _, ok, _ in results if not ok)
+        success_count = sum(ok for _, ok, _ in results)
+        fail_count = len(results) - success_count
 
-        for item, _, _ in results:
-            self.results_table.update_item_status(item)
+        # Only rows whose status actually moved need their cell rewritten.
+        self.results_table.update_items_status_bulk([
+            item for item, before in zip(selected, statuses_before) if item.status != before
+        ])
 
         msg = f"Processed {len(results)} items: {success_count} succeeded"
         if fail_count:
@@ -569,20 +813,34 @@ class AppWindow(ctk.CTk):
         self._update_stats()
 
     def _empty_trash(self):
-        from core.rules import TRASH_PATH
-        from core.utils import get_directory_size
-
         if not TRASH_PATH.exists():
             messagebox.showinfo("Trash", "Trash is already empty.")
             return
 
-        trash_size = get_directory_size(TRASH_PATH)
+        # Sizing a full Trash walks every file in it; do that off the Tk
+        # thread. The progress bar is only borrowed when no scan owns it.
+        self.trash_btn.configure(state="disabled")
+        self._trash_owns_progress = self._drain_after_id is None
+        if self._trash_owns_progress:
+            self.progress_bar.start()
+        self._when_done(self._run_in_thread(get_directory_size, TRASH_PATH), self._confirm_empty_trash)
+
+    def _confirm_empty_trash(self, trash_size: int):
+        from core.delete import empty_trash
+        from ui.confirm_dialog import ConfirmTrashDialog
+
+        self.trash_btn.configure(state="normal")
+        if self._trash_owns_progress:
+            self.progress_bar.stop()
+            self.progress_bar.set(0)
+
         if trash_size == 0:
             messagebox.showinfo("Trash", "Trash is already empty.")
             return
 
-        dialog = ConfirmTrashDialog(self, format_size(trash_size))
-        if not dialog.result:
+        if self._confirm_trash_dialog is None:
+            self._confirm_trash_dialog = ConfirmTrashDialog(self)
+        if not self._confirm_trash_dialog.ask(format_size(trash_size)):
             return
 
         success, message = empty_trash()
@@ -597,19 +855,29 @@ class AppWindow(ctk.CTk):
             messagebox.showinfo("No Data", "No scan results to export.")
             return
 
-        output_path = filedialog.asksaveasfilename(
-            title="Export CSV",
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
-            initialfile="mac_cleanup_report.csv",
-        )
+        output_path = self._export_dialog.show()
 
         if output_path:
-            try:
-                export_to_csv(items, Path(output_path))
-                messagebox.showinfo("Export Complete", f"Report saved to:\n{output_path}")
-            except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {e}")
+            self.export_btn.configure(state="disabled")
+            output_path = Path(output_path)
+            future = self._run_in_thread(self._do_export, items, output_path)
+            self._when_done(future, self._export_done, output_path)
+
+    @staticmethod
+    def _do_export(items, output_path: Path) -> Optional[Exception]:
+        """Write the CSV on a worker thread, returning the error if it failed."""
+        try:
+            export_to_csv(items, output_path)
+        except Exception as e:
+            return e
+        return None
+
+    def _export_done(self, output_path: Path, error: Optional[Exception]):
+        self.export_btn.configure(state="normal")
+        if error is None:
+            messagebox.showinfo("Export Complete", f"Report saved to:\n{output_path}")
+        else:
+            messagebox.showerror("Export Error", f"Failed to export: {error}")
 
     def _open_folder(self):
         selected = self.results_table.get_selected_items()
@@ -618,53 +886,69 @@ class AppWindow(ctk.CTk):
             return
 
         item = selected[0]
-        folder = item.path.parent if item.path.is_file() else item.path
+        folder = item.path if item.is_directory else item.path.parent
 
+        appkit = _appkit_opener()
         try:
-            if sys.platform == "darwin":
-                subprocess.run(["open", str(folder)], check=True)
-            elif sys.platform == "linux":
-                subprocess.run(["xdg-open", str(folder)], check=True)
+            if appkit is not None:
+                NSWorkspace, NSURL = appkit
+                url = NSURL.fileURLWithPath_(os.fspath(folder))
+                if not NSWorkspace.sharedWorkspace().openURL_(url):
+                    raise OSError(f"Finder could not open {folder}")
+            elif OPEN_FOLDER_ARGV is not None:
+                # Fire and forget: don't block the UI waiting for the opener.
+                opener = subprocess.Popen(
+                    OPEN_FOLDER_ARGV + [os.fspath(folder)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+                self.after(OPENER_POLL_INTERVAL_MS, self._check_opener, opener)
             else:
-                os.startfile(str(folder))
+                os.startfile(os.fspath(folder))
         except Exception as e:
             messagebox.showerror("Error", f"Could not open folder: {e}")
 
+    def _check_opener(self, opener: subprocess.Popen):
+        """Reap the folder opener and report it if it exited with an error."""
+        returncode = opener.poll()
+        if returncode is None:
+            self.after(OPENER_POLL_INTERVAL_MS, self._check_opener, opener)
+        elif returncode != 0:
+            messagebox.showerror("Error", f"Could not open folder (exit status {returncode}).")
+
     def _open_settings(self):
+        from ui.settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(self, self.settings)
         if dialog.result:
             self.settings = dialog.result
+            clear_rule_caches()
             self._update_dry_run_indicator()
 
     def _show_help(self):
-        help_text = (
-            "Mac Cleanup Tool\n"
-            "=================\n\n"
-            "Safely find and reclaim disk space on your Mac.\n\n"
-            "SAFETY:\n"
-            "  - System files are NEVER touched\n"
-            "  - Personal folders excluded by default\n"
-            "  - Dry Run mode ON by default\n"
-            "  - All deletions go to Trash\n"
-            "  - Type 'DELETE' to confirm\n\n"
-            "HOW TO USE:\n"
-            "  1. Select scan types in sidebar\n"
-            "  2. Click Scan\n"
-            "  3. Review results\n"
-            "  4. Select items to remove\n"
-            "  5. Click Delete Selected\n\n"
-            "SCAN TYPES:\n"
-            "  - Large Files (default >1 GB)\n"
-            "  - Caches (>30 days old)\n"
-            "  - Old Downloads (>90 days)\n"
-            "  - Log Files\n"
-            "  - Trash Report\n\n"
-            "SETTINGS:\n"
-            "  Adjust thresholds, Dry Run, and\n"
-            "  personal folder access."
-        )
-        messagebox.showinfo("Help", help_text)
+        messagebox.showinfo("Help", HELP_TEXT)
+
+    def _stop_scans(self):
+        """Cancel any running scan."""
+        if self._scanner:
+            self._scanner.cancel()
+
+    def _on_close(self):
+        # Give a cancelled scan a moment to unwind before the window goes.
+        # The worker never calls into Tk, so blocking here cannot deadlock,
+        # and being a daemon it cannot outlive the process past the bound.
+        self._stop_scans()
+        if self._scan_future is not None:
+            futures_wait([self._scan_future], timeout=SCAN_SHUTDOWN_TIMEOUT_S)
+        self.destroy()
 
     def run(self):
         """Start the main loop."""
-        self.mainloop()
+        try:
+            self.mainloop()
+        finally:
+            # The scan worker is a daemon and will not delay exit; still
+            # tell a running scan to stop so its pool winds down.
+            self._stop_scans()
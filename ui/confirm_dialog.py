@@ -6,71 +6,131 @@ Modern dashboard-style confirmation dialogs with CustomTkinter.
 
 import tkinter as tk
 import customtkinter as ctk
-from typing import Optional
+from typing import Optional, Tuple
+
+
+def _show_modal(
+    dialog: ctk.CTkToplevel,
+    parent: ctk.CTk,
+    size: Tuple[int, int],
+    closed: tk.BooleanVar,
+    focus: Optional[tk.Misc] = None,
+) -> None:
+    """Center a hidden dialog over parent, show it modally, and hide it again once closed is set."""
+    window_width, window_height = size
+    x = parent.winfo_rootx() + (parent.winfo_width() - window_width) // 2
+    y = parent.winfo_rooty() + (parent.winfo_height() - window_height) // 2
+    dialog.geometry(f"{window_width}x{window_height}+{x}+{y}")
+
+    closed.set(False)
+    dialog.deiconify()
+    dialog.grab_set()
+    if focus is not None:
+        focus.focus_set()
+    dialog.wait_variable(closed)
+    dialog.grab_release()
+    dialog.withdraw()
+
+
+class _TypedConfirmDialog:
+    """
+    Shared behaviour for dialogs confirmed by typing PHRASE. The confirm
+    button is only enabled while the entry holds the phrase.
+    """
+
+    PHRASE = ""
+
+    def _init_confirm_state(self, parent: ctk.CTk):
+        self.result = False
+        self._closed = tk.BooleanVar(parent, value=False)
+        self._confirm_var = tk.StringVar(parent, value="")
+        self._phrase_matches = False
+        self._confirm_var.trace_add("write", self._on_text_change)
 
+    def _on_text_change(self, *_):
+        matches = self._confirm_var.get().strip().upper() == self.PHRASE
+        if matches != self._phrase_matches:
+            self._phrase_matches = matches
+            self.confirm_btn.configure(state="normal" if matches else "disabled")
 
-class ConfirmDeleteDialog:
-    """Modal dialog requiring the user to type 'DELETE' to confirm file deletion."""
+    def _on_confirm(self):
+        if self._phrase_matches:
+            self.result = True
+            self._closed.set(True)
 
-    def __init__(self, parent: ctk.CTk, file_count: int, total_size: str, dry_run: bool):
+    def _on_cancel(self):
         self.result = False
+        self._closed.set(True)
+
+
+class ConfirmDeleteDialog(_TypedConfirmDialog):
+    """
+    Modal dialog requiring the user to type 'DELETE' to confirm file deletion.
+
+    The widgets are built once and the window is hidden between uses;
+    call ask() each time a confirmation is needed.
+    """
+
+    PHRASE = "DELETE"
+    SIZE = (440, 340)
+
+    def __init__(self, parent: ctk.CTk):
+        self.parent = parent
+        self._init_confirm_state(parent)
         self.dialog = ctk.CTkToplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Confirm Deletion")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
         self.dialog.resizable(False, False)
 
-        window_width, window_height = 440, 340
-        x = parent.winfo_rootx() + (parent.winfo_width() - window_width) // 2
-        y = parent.winfo_rooty() + (parent.winfo_height() - window_height) // 2
-        self.dialog.geometry(f"{window_width}x{window_height}+{x}+{y}")
-
         main_frame = ctk.CTkFrame(self.dialog, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=28, pady=24)
 
-        if dry_run:
-            ctk.CTkLabel(
-                main_frame,
-                text="\u26a0\ufe0f  DRY RUN IS ON",
-                font=ctk.CTkFont(size=22, weight="bold"),
-                text_color="#f59e0b",
-            ).pack(pady=(20, 12))
-
-            ctk.CTkLabel(
-                main_frame,
-                text="Dry Run mode is enabled. No files will be deleted.\nTurn off Dry Run in Settings to enable deletion.",
-                font=ctk.CTkFont(size=13),
-                text_color="#9ca3af",
-                wraplength=380,
-                justify="center",
-            ).pack(pady=(0, 24))
-
-            ctk.CTkButton(
-                main_frame, text="Got it",
-                command=self.dialog.destroy,
-                width=120, height=40, corner_radius=10,
-                font=ctk.CTkFont(size=14),
-                fg_color="#3b82f6", hover_color="#2563eb",
-            ).pack()
-            parent.wait_window(self.dialog)
-            return
+        self._dry_run_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
 
         ctk.CTkLabel(
-            main_frame,
+            self._dry_run_frame,
+            text="\u26a0\ufe0f  DRY RUN IS ON",
+            font=ctk.CTkFont(size=22, weight="bold"),
+            text_color="#f59e0b",
+        ).pack(pady=(20, 12))
+
+        ctk.CTkLabel(
+            self._dry_run_frame,
+            text="Dry Run mode is enabled. No files will be deleted.\nTurn off Dry Run in Settings to enable deletion.",
+            font=ctk.CTkFont(size=13),
+            text_color="#9ca3af",
+            wraplength=380,
+            justify="center",
+        ).pack(pady=(0, 24))
+
+        ctk.CTkButton(
+            self._dry_run_frame, text="Got it",
+            command=self._on_cancel,
+            width=120, height=40, corner_radius=10,
+            font=ctk.CTkFont(size=14),
+            fg_color="#3b82f6", hover_color="#2563eb",
+        ).pack()
+
+        self._confirm_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+
+        ctk.CTkLabel(
+            self._confirm_frame,
             text="\U0001f5d1\ufe0f  Confirm Deletion",
             font=ctk.CTkFont(size=22, weight="bold"),
             text_color="#ef4444",
         ).pack(pady=(0, 12))
 
-        info_card = ctk.CTkFrame(main_frame, corner_radius=10, fg_color="#1a1b1e")
+        info_card = ctk.CTkFrame(self._confirm_frame, corner_radius=10, fg_color="#1a1b1e")
         info_card.pack(fill="x", pady=(0, 12))
 
-        ctk.CTkLabel(
+        self._summary_label = ctk.CTkLabel(
             info_card,
-            text=f"{file_count} item(s)  \u2022  {total_size}",
+            text="",
             font=ctk.CTkFont(size=16, weight="bold"),
             text_color="#e5e7eb",
-        ).pack(pady=(12, 4))
+        )
+        self._summary_label.pack(pady=(12, 4))
 
         ctk.CTkLabel(
             info_card,
@@ -80,31 +140,32 @@ class ConfirmDeleteDialog:
         ).pack(pady=(0, 12))
 
         ctk.CTkLabel(
-            main_frame,
+            self._confirm_frame,
             text="Type DELETE to confirm:",
             font=ctk.CTkFont(size=13),
             text_color="#9ca3af",
         ).pack(pady=(0, 6))
 
         self.confirm_entry = ctk.CTkEntry(
-            main_frame, width=200, height=40,
+            self._confirm_frame, width=200, height=40,
             corner_radius=10, font=ctk.CTkFont(size=15),
             justify="center",
-            placeholder_text="DELETE",
+            textvariable=self._confirm_var,
         )
         self.confirm_entry.pack(pady=(0, 16))
-        self.confirm_entry.focus_set()
 
-        btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        btn_frame = ctk.CTkFrame(self._confirm_frame, fg_color="transparent")
         btn_frame.pack()
 
-        ctk.CTkButton(
+        self.confirm_btn = ctk.CTkButton(
             btn_frame, text="Delete",
             command=self._on_confirm,
+            state="disabled",
             width=110, height=40, corner_radius=10,
             font=ctk.CTkFont(size=14, weight="bold"),
             fg_color="#dc2626", hover_color="#b91c1c",
-        ).pack(side="left", padx=4)
+        )
+        self.confirm_btn.pack(side="left", padx=4)
 
         ctk.CTkButton(
             btn_frame, text="Cancel",
@@ -117,34 +178,43 @@ class ConfirmDeleteDialog:
 
         self.confirm_entry.bind("<Return>", lambda e: self._on_confirm())
         self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
-        parent.wait_window(self.dialog)
-
-    def _on_confirm(self):
-        if self.confirm_entry.get().strip().upper() == "DELETE":
-            self.result = True
-            self.dialog.destroy()
-
-    def _on_cancel(self):
-        self.result = False
-        self.dialog.destroy()
 
-
-class ConfirmTrashDialog:
-    """Modal dialog for emptying the Trash. Requires typing 'EMPTY TRASH' to confirm."""
-
-    def __init__(self, parent: ctk.CTk, trash_size: str):
+    def ask(self, file_count: int, total_size: str, dry_run: bool) -> bool:
+        """Show the dialog for this deletion and return True if the user confirmed."""
         self.result = False
+        if dry_run:
+            self._confirm_frame.pack_forget()
+            self._dry_run_frame.pack(fill="both", expand=True)
+            focus = None
+        else:
+            self._dry_run_frame.pack_forget()
+            self._summary_label.configure(text=f"{file_count} item(s)  \u2022  {total_size}")
+            self._confirm_var.set("")
+            self._confirm_frame.pack(fill="both", expand=True)
+            focus = self.confirm_entry
+        _show_modal(self.dialog, self.parent, self.SIZE, self._closed, focus)
+        return self.result
+
+
+class ConfirmTrashDialog(_TypedConfirmDialog):
+    """
+    Modal dialog for emptying the Trash. Requires typing 'EMPTY TRASH' to confirm.
+
+    Built once and hidden between uses, like ConfirmDeleteDialog.
+    """
+
+    PHRASE = "EMPTY TRASH"
+    SIZE = (440, 320)
+
+    def __init__(self, parent: ctk.CTk):
+        self.parent = parent
+        self._init_confirm_state(parent)
         self.dialog = ctk.CTkToplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Empty Trash")
         self.dialog.transient(parent)
-        self.dialog.grab_set()
         self.dialog.resizable(False, False)
 
-        window_width, window_height = 440, 320
-        x = parent.winfo_rootx() + (parent.winfo_width() - window_width) // 2
-        y = parent.winfo_rooty() + (parent.winfo_height() - window_height) // 2
-        self.dialog.geometry(f"{window_width}x{window_height}+{x}+{y}")
-
         main_frame = ctk.CTkFrame(self.dialog, fg_color="transparent")
         main_frame.pack(fill="both", expand=True, padx=28, pady=24)
 
@@ -158,12 +228,13 @@ class ConfirmTrashDialog:
         info_card = ctk.CTkFrame(main_frame, corner_radius=10, fg_color="#1a1b1e")
         info_card.pack(fill="x", pady=(0, 12))
 
-        ctk.CTkLabel(
+        self._size_label = ctk.CTkLabel(
             info_card,
-            text=f"Trash size: {trash_size}",
+            text="",
             font=ctk.CTkFont(size=16, weight="bold"),
             text_color="#e5e7eb",
-        ).pack(pady=(12, 4))
+        )
+        self._size_label.pack(pady=(12, 4))
 
         ctk.CTkLabel(
             info_card,
@@ -183,21 +254,22 @@ class ConfirmTrashDialog:
             main_frame, width=240, height=40,
             corner_radius=10, font=ctk.CTkFont(size=15),
             justify="center",
-            placeholder_text="EMPTY TRASH",
+            textvariable=self._confirm_var,
         )
         self.confirm_entry.pack(pady=(0, 16))
-        self.confirm_entry.focus_set()
 
         btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
         btn_frame.pack()
 
-        ctk.CTkButton(
+        self.confirm_btn = ctk.CTkButton(
             btn_frame, text="Empty Trash",
             command=self._on_confirm,
+            state="disabled",
             width=130, height=40, corner_radius=10,
             font=ctk.CTkFont(size=14, weight="bold"),
             fg_color="#dc2626", hover_color="#b91c1c",
-        ).pack(side="left", padx=4)
+        )
+        self.confirm_btn.pack(side="left", padx=4)
 
         ctk.CTkButton(
             btn_frame, text="Cancel",
@@ -210,13 +282,11 @@ class ConfirmTrashDialog:
 
         self.confirm_entry.bind("<Return>", lambda e: self._on_confirm())
         self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
-        parent.wait_window(self.dialog)
-
-    def _on_confirm(self):
-        if self.confirm_entry.get().strip().upper() == "EMPTY TRASH":
-            self.result = True
-            self.dialog.destroy()
 
-    def _on_cancel(self):
+    def ask(self, trash_size: str) -> bool:
+        """Show the dialog for the current Trash size and return True if the user confirmed."""
         self.result = False
-        self.dialog.destroy()
+        self._size_label.configure(text=f"Trash size: {trash_size}")
+        self._confirm_var.set("")
+        _show_modal(self.dialog, self.parent, self.SIZE, self._closed, self.confirm_entry)
+        return self.result
@@ -6,8 +6,9 @@ with sortable columns and per-item checkboxes.
 """
 
 import tkinter as tk
+from itertools import islice
 from tkinter import ttk
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Set
 
 import customtkinter as ctk
 
@@ -24,15 +25,22 @@ class ResultsTable(ctk.CTkFrame):
     COLUMNS = ("selected", "category", "size", "last_modified", "path", "action", "status")
     HEADERS = ("\u2610", "Category", "Size", "Modified", "Path", "Action", "Status")
     WIDTHS = (36, 100, 80, 120, 320, 180, 70)
+    POPULATE_CHUNK = 500
 
     def __init__(self, parent: tk.Widget):
         super().__init__(parent, fg_color="transparent", corner_radius=0)
         self._items: Dict[str, ScanItem] = {}
-        self._selected: Dict[str, ctk.BooleanVar] = {}
+        # Checked rows are tracked in Python; a Tk variable per row would
+        # cost a Tcl round-trip for every inserted item.
+        self._selected: Set[str] = set()
+        self._selected_size = 0
+        self._pending_rows: Optional[Iterator[ScanItem]] = None
+        self._pump_after_id: Optional[str] = None
+        self._selection_callback: Optional[Callable[[], None]] = None
         self._setup_ui()
 
     def _setup_ui(self):
-        inner = tk.Frame(self, bg="#1d1e1e")
+        inner = ttk.Frame(self, style="Results.TFrame")
         inner.pack(fill="both", expand=True)
 
         y_scroll = ttk.Scrollbar(inner, orient="vertical")
@@ -66,18 +74,79 @@ class ResultsTable(ctk.CTkFrame):
 
         self._sort_reverse: Dict[str, bool] = {col: False for col in self.COLUMNS}
 
+    def set_selection_callback(self, callback: Callable[[], None]):
+        """Set a callback run whenever the user checks or unchecks rows."""
+        self._selection_callback = callback
+
+    def _selection_changed(self):
+        if self._selection_callback is not None:
+            self._selection_callback()
+
     def clear(self):
+        self._cancel_pump()
         self.tree.delete(*self.tree.get_children())
         self._items.clear()
         self._selected.clear()
+        self._selected_size = 0
 
     def populate(self, items: List[ScanItem]):
         self.clear()
-        for i, item in enumerate(items):
+        self.append_items(items)
+
+    def populate_incremental(self, items: List[ScanItem]):
+        """
+        Replace the table contents POPULATE_CHUNK rows per event-loop tick,
+        so large result sets do not freeze the window while inserting.
+        Rows already showing exactly these items are reordered in place.
+        """
+        if self._pending_rows is None and self._reorder_rows(items):
+            return
+        self.clear()
+        self._pending_rows = iter(items)
+        self._pump_after_id = self.after(1, self._pump_rows)
+
+    def _pump_rows(self):
+        self._pump_after_id = None
+        if self._pending_rows is None:
+            return
+        chunk = list(islice(self._pending_rows, self.POPULATE_CHUNK))
+        self.append_items(chunk)
+        if len(chunk) < self.POPULATE_CHUNK:
+            self._pending_rows = None
+            return
+        self._pump_after_id = self.after(1, self._pump_rows)
+
+    def _reorder_rows(self, items: List[ScanItem]) -> bool:
+        """
+        If the table holds exactly these item objects, move the rows into
+        the given order and return True. Otherwise leave it untouched.
+        """
+        if len(items) != len(self._items):
+            return False
+        iid_by_item = {id(stored): iid for iid, stored in self._items.items()}
+        order = [iid_by_item.get(id(item)) for item in items]
+        if None in order or len(set(order)) != len(order):
+            return False
+        if order != list(self.tree.get_children()):
+            move = self.tree.move
+            retag = self.tree.item
+            for index, iid in enumerate(order):
+                move(iid, "", index)
+                retag(iid, tags=("even" if index % 2 == 0 else "odd",))
+        return True
+
+    def _cancel_pump(self):
+        if self._pump_after_id is not None:
+            self.after_cancel(self._pump_after_id)
+            self._pump_after_id = None
+        self._pending_rows = None
+
+    def append_items(self, items: List[ScanItem]):
+        """Add rows after the existing ones without rebuilding the table."""
+        rows = []
+        for i, item in enumerate(items, len(self._items)):
             iid = f"item_{i}"
             self._items[iid] = item
-            self._selected[iid] = ctk.BooleanVar(value=False)
-
             values = (
                 "\u2610",
                 item.category.value,
@@ -87,8 +156,12 @@ class ResultsTable(ctk.CTkFrame):
                 item.recommended_action,
                 item.status.value,
             )
-            tag = "even" if i % 2 == 0 else "odd"
-            self.tree.insert("", "end", iid=iid, values=values, tags=(tag,))
+            rows.append((iid, values, ("even" if i % 2 == 0 else "odd",)))
+
+        # All formatting is done above so this loop only talks to Tk.
+        insert = self.tree.insert
+        for iid, values, tags in rows:
+            insert("", "end", iid=iid, values=values, tags=tags)
 
     def _on_click(self, event):
         region = self.tree.identify_region(event.x, event.y)
@@ -100,45 +173,67 @@ class ResultsTable(ctk.CTkFrame):
             return
 
         iid = self.tree.identify_row(event.y)
-        if not iid or iid not in self._selected:
+        if not iid or iid not in self._items:
             return
 
-        var = self._selected[iid]
-        var.set(not var.get())
+        checked = iid not in self._selected
+        self._set_checked(iid, checked)
 
         current = list(self.tree.item(iid, "values"))
-        current[0] = "\u2611" if var.get() else "\u2610"
+        current[0] = "\u2611" if checked else "\u2610"
         self.tree.item(iid, values=current)
+        self._selection_changed()
 
     def select_all_category(self, category: ScanCategory, select: bool = True):
         for iid, item in self._items.items():
             if item.category == category:
-                self._selected[iid].set(select)
+                self._set_checked(iid, select)
                 current = list(self.tree.item(iid, "values"))
                 current[0] = "\u2611" if select else "\u2610"
                 self.tree.item(iid, values=current)
+        self._selection_changed()
 
     def select_all(self, select: bool = True):
         for iid in self._items:
-            self._selected[iid].set(select)
+            self._set_checked(iid, select)
             current = list(self.tree.item(iid, "values"))
             current[0] = "\u2611" if select else "\u2610"
             self.tree.item(iid, values=current)
+        self._selection_changed()
+
+    def _set_checked(self, iid: str, checked: bool):
+        """Add or remove a row from the selection, keeping the size total in step."""
+        selected = self._selected
+        if checked:
+            if iid not in selected:
+                selected.add(iid)
+                self._selected_size += self._items[iid].size_bytes
+        elif iid in selected:
+            selected.discard(iid)
+            self._selected_size -= self._items[iid].size_bytes
 
     def get_selected_items(self) -> List[ScanItem]:
-        return [
-            self._items[iid]
-            for iid, var in self._selected.items()
-            if var.get()
-        ]
+        selected = self._selected
+        return [item for iid, item in self._items.items() if iid in selected]
+
+    def selected_count(self) -> int:
+        return len(self._selected)
+
+    def get_selected_size(self) -> int:
+        """Total size_bytes of the checked rows, maintained as rows are toggled."""
+        return self._selected_size
 
     def update_item_status(self, item: ScanItem):
-        for iid, stored_item in self._items.items():
-            if stored_item is item:
-                current = list(self.tree.item(iid, "values"))
-                current[6] = item.status.value
-                self.tree.item(iid, values=current)
-                break
+        self.update_items_status_bulk([item])
+
+    def update_items_status_bulk(self, items: List[ScanItem]):
+        """Refresh the Status cell of many items with one lookup table."""
+        iid_by_item = {id(stored): iid for iid, stored in self._items.items()}
+        set_cell = self.tree.set
+        for item in items:
+            iid = iid_by_item.get(id(item))
+            if iid is not None:
+                set_cell(iid, "status", item.status.value)
 
     def _sort_by(self, column: str):
         col_index = self.COLUMNS.index(column)